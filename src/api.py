@@ -11,13 +11,15 @@ size limits, timeouts, request-id middleware, and JSON structured logging.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import tempfile
 import uuid
+from collections import OrderedDict
 from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from fastapi import FastAPI, HTTPException, Request, UploadFile
 from fastapi.exceptions import RequestValidationError
@@ -36,13 +38,15 @@ from .core.config import (
 )
 from .core.schema import UniversalCarrierFormat
 from .extraction_pipeline import ExtractionPipeline
-from .mappers import CarrierRegistry
+from .mappers import CarrierMapperBase, CarrierRegistry
 from .openapi_generator import generate_openapi
 
 # ----- Limits (reject early: 413 payload too large, 422 validation) -----
 MAX_UPLOAD_BYTES = 50 * 1024 * 1024  # 50 MB for PDF or form
 MAX_EXTRACTED_TEXT_CHARS = 2_000_000  # 2M chars for extracted_text (JSON mode)
 MAX_CONVERT_BODY_BYTES = 1 * 1024 * 1024  # 1 MB for /convert JSON
+MAX_CONVERT_BATCH_ITEMS = 500  # carrier responses per /convert/batch request
+MAX_CONVERT_BATCH_BODY_BYTES = 10 * 1024 * 1024  # 10 MB for /convert/batch JSON
 
 # ----- Async extract jobs (imp-25): in-memory store (jobs lost on restart) -----
 _extract_jobs: Dict[str, Dict[str, Any]] = {}
@@ -55,6 +59,43 @@ def _extract_timeout_seconds() -> int:
     return get_settings().extract_timeout_seconds
 
 
+# ----- /convert result cache (opt-in): duplicate webhooks / polls skip mapping -----
+# LRU keyed by (mapper class, payload digest); results are shared, never mutate.
+_convert_cache: "OrderedDict[Tuple[Type[CarrierMapperBase], bytes], Dict[str, Any]]" = (
+    OrderedDict()
+)
+
+
+def _convert_cache_size() -> int:
+    """Max cached /convert results (env CONVERT_CACHE_SIZE, default 0 = off)."""
+    from .core.settings import get_settings
+
+    return get_settings().convert_cache_size
+
+
+def _map_tracking_cached(
+    mapper: CarrierMapperBase, carrier_response: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Map a tracking response, reusing the result for a byte-identical payload."""
+    size = _convert_cache_size()
+    if size <= 0:
+        return mapper.map_tracking_response(carrier_response)
+    payload = json.dumps(carrier_response, sort_keys=True, separators=(",", ":"))
+    key = (
+        type(mapper),
+        hashlib.blake2b(payload.encode(), digest_size=16).digest(),
+    )
+    cached = _convert_cache.get(key)
+    if cached is not None:
+        _convert_cache.move_to_end(key)
+        return cached
+    universal = mapper.map_tracking_response(carrier_response)
+    _convert_cache[key] = universal
+    if len(_convert_cache) > size:
+        _convert_cache.popitem(last=False)
+    return universal
+
+
 # Request ID for structured logging (set by middleware)
 request_id_ctx: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
@@ -187,7 +228,7 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
 
 # ----- Body size limit middleware -----
 class BodySizeLimitMiddleware(BaseHTTPMiddleware):
-    """Reject requests with Content-Length over limit for /extract and /convert (413)."""
+    """Reject requests with Content-Length over limit for /extract and /convert[/batch] (413)."""
 
     async def dispatch(self, request: Request, call_next):
         if request.method != "POST":
@@ -212,6 +253,12 @@ class BodySizeLimitMiddleware(BaseHTTPMiddleware):
                 "payload_too_large",
                 f"Request body must be at most {MAX_CONVERT_BODY_BYTES} bytes.",
             )
+        if path == "/convert/batch" and cl > MAX_CONVERT_BATCH_BODY_BYTES:
+            return _error_response(
+                413,
+                "payload_too_large",
+                f"Request body must be at most {MAX_CONVERT_BATCH_BODY_BYTES} bytes.",
+            )
         return await call_next(request)
 
 
@@ -277,6 +324,20 @@ class ConvertRequest(BaseModel):
     )
 
 
+class ConvertBatchRequest(BaseModel):
+    """Request body for converting many carrier responses in one call."""
+
+    carrier_responses: List[Dict[str, Any]] = Field(
+        ...,
+        max_length=MAX_CONVERT_BATCH_ITEMS,
+        description="Messy carrier API responses, all from the same carrier.",
+    )
+    carrier: Optional[str] = Field(
+        default="example",
+        description="Carrier slug for mapper selection (e.g. example, dhl, royal_mail). Use GET /carriers for list.",
+    )
+
+
 class JobAcceptedResponse(BaseModel):
     """Response when POST /extract is called with ?async=1 (202 Accepted)."""
 
@@ -383,6 +444,7 @@ def root() -> Dict[str, str]:
         "extract": "POST /extract (PDF file or JSON with extracted_text; ?async=1 for async job)",
         "extract_jobs": "GET /extract/jobs/{job_id} (poll async extract result)",
         "convert": "POST /convert (carrier response → universal JSON)",
+        "convert_batch": "POST /convert/batch (list of carrier responses → list of universal JSON)",
         "carrier_openapi": "GET /carriers/{name}/openapi.yaml (OpenAPI for a carrier schema)",
     }
 
@@ -621,8 +683,8 @@ async def convert(req: ConvertRequest) -> Dict[str, Any]:
     Uses the mapper registered for the given carrier slug (default: example).
     """
     try:
-        mapper = CarrierRegistry.get(req.carrier or "example")
-        universal = mapper.map_tracking_response(req.carrier_response)
+        mapper = CarrierRegistry.get_instance(req.carrier or "example")
+        universal = _map_tracking_cached(mapper, req.carrier_response)
         return universal
     except KeyError as e:
         raise HTTPException(404, str(e)) from e
@@ -632,6 +694,31 @@ async def convert(req: ConvertRequest) -> Dict[str, Any]:
         raise HTTPException(400, f"Conversion failed: {e}") from e
 
 
+@app.post(
+    "/convert/batch",
+    response_model=List[Dict[str, Any]],
+    summary="Convert a batch of carrier responses to universal JSON",
+    description=(
+        "Send up to %d carrier responses for one carrier; returns the universal "
+        "JSON for each, in request order." % MAX_CONVERT_BATCH_ITEMS
+    ),
+)
+async def convert_batch(req: ConvertBatchRequest) -> List[Dict[str, Any]]:
+    """
+    Convert a batch of carrier responses with one mapper lookup.
+
+    Uses the mapper registered for the given carrier slug (default: example)
+    and its map_tracking_responses batch method.
+    """
+    try:
+        mapper = CarrierRegistry.get_instance(req.carrier or "example")
+        return mapper.map_tracking_responses(req.carrier_responses)
+    except KeyError as e:
+        raise HTTPException(404, str(e)) from e
+    except Exception as e:
+        raise HTTPException(400, f"Conversion failed: {e}") from e
+
+
 @app.get(
     "/carriers/{name}/openapi.yaml",
     response_class=PlainTextResponse,
@@ -59,6 +59,12 @@ DEFAULT_LLM_CHUNK_OVERLAP_CHARS = (
     500  # Overlap between chunks to avoid cutting mid-sentence
 )
 
+# ----- Carrier mappers -----
+# Set to 0/false/no to skip importing (and registering) the reference example
+# mappers when src.mappers loads. Default: included (API /convert defaults to
+# the "example" carrier).
+INCLUDE_EXAMPLE_MAPPERS_ENV = "UCF_INCLUDE_EXAMPLES"
+
 # ----- Pipeline progress step names (used by extraction_pipeline + formatter CLI) -----
 STEP_PARSE = "parse"
 STEP_EXTRACT = "extract"
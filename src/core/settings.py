@@ -37,6 +37,7 @@ class Settings:
         self._anthropic_api_key: Optional[str] = None
         self._llm_provider: Optional[str] = None
         self._extract_timeout_seconds: Optional[int] = None
+        self._convert_cache_size: Optional[int] = None
 
     @property
     def openai_api_key(self) -> Optional[str]:
@@ -74,6 +75,14 @@ class Settings:
             self._extract_timeout_seconds = max(1, val)
         return self._extract_timeout_seconds
 
+    @property
+    def convert_cache_size(self) -> int:
+        """CONVERT_CACHE_SIZE from env (default 0 = /convert result cache off)."""
+        if self._convert_cache_size is None:
+            val = _int_env("CONVERT_CACHE_SIZE", 0)
+            self._convert_cache_size = max(0, val)
+        return self._convert_cache_size
+
     def openai_api_key_set(self) -> bool:
         """True if OPENAI_API_KEY is set (safe to log)."""
         return bool(self.openai_api_key)
@@ -4,23 +4,51 @@ Mappers package – Registry / Plugin architecture for carrier mappers.
 Import base and registry, then import mapper modules so they self-register.
 New carriers: add one mapping file that inherits CarrierMapperBase (or
 CarrierAbstract) and uses @register_carrier("slug"); no changes to core or API.
+
+The reference example mappers are imported unless UCF_INCLUDE_EXAMPLES is set
+to 0/false/no; when skipped, accessing ExampleMapper / ExampleTemplateMapper on
+this package imports (and registers) them on demand.
 """
 
-from .base import CarrierAbstract, CarrierMapperBase
+import importlib
+import os
+from typing import Any
 
-# Import mappers so they register with CarrierRegistry
-from .example_mapper import ExampleMapper
-from .example_template_mapper import ExampleTemplateMapper
-from .registry import CarrierRegistry, register_carrier
-from .royal_mail_mapper import RoyalMailRestApiMapper
+from ..core.config import INCLUDE_EXAMPLE_MAPPERS_ENV
+from .base import CarrierAbstract, CarrierMapperBase
 
 # Generated mappers (e.g. from mapper_generator_cli) inherit CarrierMapperBase and
 # use @register_carrier("slug"), so they self-register when imported. Add an
 # import for each generated mapper module here so it registers.
-try:
-    from .dhl_express_mapper import DhlExpressMapper  # noqa: F401
-except ImportError:
-    DhlExpressMapper = None  # type: ignore[misc, assignment]
+from .dhl_express_mapper import MydhlMapper
+from .registry import CarrierRegistry, register_carrier
+from .royal_mail_mapper import RoyalMailRestApiMapper
+
+# Reference mappers: exported name -> module (relative to this package)
+_EXAMPLE_MAPPERS = {
+    "ExampleMapper": ".example_mapper",
+    "ExampleTemplateMapper": ".example_template_mapper",
+}
+
+if os.environ.get(INCLUDE_EXAMPLE_MAPPERS_ENV, "1").strip().lower() not in (
+    "0",
+    "false",
+    "no",
+):
+    # Import mappers so they register with CarrierRegistry
+    from .example_mapper import ExampleMapper
+    from .example_template_mapper import ExampleTemplateMapper
+
+
+def __getattr__(name: str) -> Any:
+    """Import example mappers lazily when they were not loaded at startup."""
+    module_name = _EXAMPLE_MAPPERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CarrierAbstract",
@@ -30,5 +58,5 @@ __all__ = [
     "ExampleMapper",
     "ExampleTemplateMapper",
     "RoyalMailRestApiMapper",
-    "DhlExpressMapper",
+    "MydhlMapper",
 ]
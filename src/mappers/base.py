@@ -8,7 +8,7 @@ and registers; no changes to core or API.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Mapping
 
 from ..core.schema import UniversalCarrierFormat
 
@@ -29,9 +29,13 @@ class CarrierMapperBase(ABC):
             def map_tracking_response(self, carrier_response): ...
     """
 
+    # Mappers are stateless; no per-instance __dict__. Subclasses that need
+    # instance state must declare their own __slots__.
+    __slots__ = ()
+
     # Subclasses may define for documentation / codegen; not required by base.
-    FIELD_MAPPING: Dict[str, Any] = {}
-    STATUS_MAPPING: Dict[str, str] = {}
+    FIELD_MAPPING: Mapping[str, Any] = {}
+    STATUS_MAPPING: Mapping[str, str] = {}
 
     @abstractmethod
     def map_tracking_response(self, carrier_response: Dict[str, Any]) -> Dict[str, Any]:
@@ -46,6 +50,21 @@ class CarrierMapperBase(ABC):
         """
         ...
 
+    def map_tracking_responses(
+        self, carrier_responses: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Map a batch of carrier tracking responses, preserving order.
+
+        Args:
+            carrier_responses: Raw API responses from the carrier.
+
+        Returns:
+            List of universal dicts, one per response (see map_tracking_response).
+        """
+        map_one = self.map_tracking_response
+        return [map_one(response) for response in carrier_responses]
+
     def map_carrier_schema(
         self, carrier_schema: Dict[str, Any]
     ) -> UniversalCarrierFormat:
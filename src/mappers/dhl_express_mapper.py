@@ -1,19 +1,21 @@
-from datetime import datetime
-from typing import Any, Dict, Optional
+import heapq
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, TypedDict
 
 from ..core import UniversalFieldNames
 from ..core.schema import UniversalCarrierFormat
 from .base import CarrierMapperBase
 from .registry import register_carrier
 
-
-@register_carrier("mydhl")
-class MydhlMapper(CarrierMapperBase):
-    """
-    Mapper class for MYDHL carrier API responses to Universal Carrier Format.
-    """
-
-    FIELD_MAPPING = {
+# Read-only lookup tables shared by every instance; the class attributes below
+# alias them for documentation / codegen.
+_FIELD_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
         "AWBNumber": UniversalFieldNames.TRACKING_NUMBER,
         "ActionStatus": UniversalFieldNames.STATUS,
         "MessageTime": UniversalFieldNames.LAST_UPDATE,
@@ -37,8 +39,10 @@ class MydhlMapper(CarrierMapperBase):
         "ServiceAreaCode": UniversalFieldNames.CURRENT_LOCATION,
         "TrackingNumber": UniversalFieldNames.TRACKING_NUMBER,
     }
+)
 
-    STATUS_MAPPING = {
+_STATUS: Mapping[str, str] = MappingProxyType(
+    {
         "Success": "delivered",
         "No Shipments Found": "not_found",
         "In Transit": "in_transit",
@@ -46,6 +50,252 @@ class MydhlMapper(CarrierMapperBase):
         "Exception": "exception",
         "Pending": "pending",
     }
+)
+
+# DHL is inconsistent about status casing ("In Transit" vs "in transit"), so
+# statuses are keyed by both the documented spelling and its lowercase form:
+# the usual exactly-cased status needs no .lower() call. Keys are interned
+# once here so repeated lookups hit the identity fast path.
+_STATUS_LOOKUP: Mapping[str, str] = MappingProxyType(
+    {
+        sys.intern(key): sys.intern(value)
+        for raw, value in _STATUS.items()
+        for key in (raw, raw.lower())
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _normalise_status(status: str) -> str:
+    """Map a status that missed _STATUS_LOOKUP: case-fold, then pass through.
+
+    New/unknown DHL statuses recur across a batch; caching the miss path keeps
+    repeated unknowns from allocating a fresh lowercase string every time.
+    """
+    status_key = status.lower()
+    return _STATUS_LOOKUP.get(status_key, status_key)
+
+
+# Shape of the MYDHL tracking payload as read by this mapper. Every key is
+# optional on the wire (total=False); these types document the nesting walked
+# by _dig() and let type checkers see the event fields used per piece event.
+class _ServiceEvent(TypedDict, total=False):
+    EventCode: str
+    Description: str
+
+
+class _ServiceArea(TypedDict, total=False):
+    ServiceAreaCode: str
+    Description: str
+
+
+class _PieceEvent(TypedDict, total=False):
+    Date: str
+    Time: str
+    GMTOffset: str
+    ServiceEvent: _ServiceEvent
+    ServiceArea: _ServiceArea
+
+
+class _AWBInfo(TypedDict, total=False):
+    AWBNumber: str
+    Status: Dict[str, Any]
+    ShipmentInfo: Dict[str, Any]
+    Pieces: Dict[str, Any]
+
+
+# A mapped event's values in _EVENT_KEYS order, paired with its sort key
+# (see _event_sort_key). Rows become dicts (or columns) only after ordering.
+_EventValues = Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]
+_KeyedEvent = Tuple[datetime, _EventValues]
+
+# Universal event keys, in the order _event_values() returns them.
+_EVENT_KEYS = (
+    UniversalFieldNames.EVENT_DATETIME,
+    UniversalFieldNames.EVENT_TYPE,
+    UniversalFieldNames.EVENT_DESCRIPTION,
+    UniversalFieldNames.EVENT_LOCATION,
+)
+
+
+def _dig(data: Any, *keys: str) -> Any:
+    """Walk nested dicts by key; return None if a key is missing or not a dict."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+        if data is None:
+            return None
+    return data
+
+
+# GMTOffset as sent by MYDHL: optional sign, HH, MM (00-59) and optional SS
+# (00-59), colon-separated or not but consistently, as strptime's %z requires.
+# Groups: sign, hours, separator, minutes, seconds.
+_GMT_OFFSET_RE = re.compile(r"^([+-]?)(\d{2})(:?)([0-5]\d)(?:\3([0-5]\d))?$")
+
+
+# Sort key for events without a parseable datetime (they sort first).
+_MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _event_sort_key(dt: Optional[datetime]) -> datetime:
+    """Return an aware datetime for ordering; naive values are treated as UTC."""
+    if dt is None:
+        return _MIN_DATETIME
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+@lru_cache(maxsize=64)
+def _fixed_offset(
+    sign: str, hours: str, minutes: str, seconds: Optional[str]
+) -> Tuple[timezone, str]:
+    """Return the tzinfo for a parsed GMTOffset (no sign = +) and its ISO suffix."""
+    hh, mm, ss = int(hours), int(minutes), int(seconds or 0)
+    delta = timedelta(hours=hh, minutes=mm, seconds=ss)
+    tzinfo = timezone(-delta if sign == "-" else delta)
+    # Same rendering as datetime.isoformat(): "-00:00" is UTC, shown as "+00:00",
+    # and seconds appear only when non-zero.
+    sign = "-" if sign == "-" and delta else "+"
+    suffix = f"{sign}{hh:02d}:{mm:02d}"
+    return tzinfo, f"{suffix}:{ss:02d}" if ss else suffix
+
+
+# Zero-padded YYYY-MM-DD / HH:MM:SS, the shapes MYDHL documents. Only these
+# take the fast paths below; anything else falls back to the original strptime
+# formats, so the set of accepted inputs is unchanged (fromisoformat alone
+# would also take week dates, HH:MM times, ... and differs across Pythons).
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_ISO_TIME_RE = re.compile(r"[0-9]{2}:[0-9]{2}:[0-9]{2}")
+
+_DATE_FORMATS = ("%Y-%m-%d", "%Y%m%d", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S")
+_EVENT_DATETIME_FORMATS = ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d")
+
+
+def _strptime_any(value: str, formats: Sequence[str]) -> Optional[datetime]:
+    """Parse value with the first matching strptime format, else None."""
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+# Parsing cores are free functions so lru_cache keys on the strings alone (no
+# self) and the cache is shared by every mapper instance. Results are
+# immutable (str / datetime), so handing out cached values is safe.
+@lru_cache(maxsize=2048)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """Parse a MYDHL date string to ISO 8601; see MydhlMapper._parse_date."""
+    # Dispatch on shape instead of trying strptime formats one by one:
+    # YYYYMMDD (8 digits), YYYY-MM-DD, or YYYY-MM-DDTHH:MM:SS with an
+    # optional Z / +HHMM / +HH:MM suffix.
+    n = len(date_str)
+    try:
+        if n == 8 and date_str.isascii() and date_str.isdigit():
+            return datetime(
+                int(date_str[:4]), int(date_str[4:6]), int(date_str[6:])
+            ).isoformat()
+        if n == 10 and _ISO_DATE_RE.fullmatch(date_str):
+            return datetime(
+                int(date_str[:4]), int(date_str[5:7]), int(date_str[8:])
+            ).isoformat()
+        if (
+            n >= 19
+            and date_str[10] == "T"
+            and _ISO_DATE_RE.match(date_str)
+            and _ISO_TIME_RE.fullmatch(date_str, 11, 19)
+        ):
+            offset: Optional[str] = date_str[19:]
+            if offset == "Z":
+                offset = "+00:00"
+            elif offset:
+                match = _GMT_OFFSET_RE.match(offset)
+                offset = (
+                    _fixed_offset(*match.group(1, 2, 4, 5))[1]
+                    if match is not None and match.group(1)
+                    else None
+                )
+            if offset is not None:
+                return datetime.fromisoformat(date_str[:19] + offset).isoformat()
+    except ValueError:
+        pass
+    dt = _strptime_any(date_str, _DATE_FORMATS)
+    return dt.isoformat() if dt is not None else None
+
+
+# A parsed event time: the datetime (for ordering) and its ISO 8601 string.
+_EventTime = Tuple[datetime, str]
+
+
+@lru_cache(maxsize=2048)
+def _parse_event_dt_cached(
+    date_str: str, time_str: Optional[str], gmt_offset: Optional[str]
+) -> Optional[_EventTime]:
+    """Parse a MYDHL event Date/Time/GMTOffset triple; see _parse_event_datetime."""
+    tzinfo = None
+    suffix = ""
+    if gmt_offset:
+        # "+0100" / "01:00" / "-05:00": build the tzinfo straight from the match
+        match = _GMT_OFFSET_RE.match(gmt_offset.strip())
+        # An offset without a time of day cannot be anchored.
+        if match is None or not time_str:
+            return None
+        try:
+            tzinfo, suffix = _fixed_offset(*match.group(1, 2, 4, 5))
+        except ValueError:
+            return None
+
+    # Canonical YYYY-MM-DD / HH:MM:SS: build the datetime from the digits and
+    # reuse the input strings, which are already what isoformat() would emit.
+    if _ISO_DATE_RE.fullmatch(date_str) and (
+        time_str is None or _ISO_TIME_RE.fullmatch(time_str)
+    ):
+        hms = (
+            (int(time_str[:2]), int(time_str[3:5]), int(time_str[6:]))
+            if time_str
+            else (0, 0, 0)
+        )
+        try:
+            dt = datetime(
+                int(date_str[:4]),
+                int(date_str[5:7]),
+                int(date_str[8:]),
+                *hms,
+                tzinfo=tzinfo,
+            )
+        except ValueError:
+            return None
+        return dt, f"{date_str}T{time_str or '00:00:00'}{suffix}"
+
+    # Anything else (e.g. unpadded "2024-1-5" / "9:30:00") goes through the
+    # original strptime formats.
+    parsed = _strptime_any(
+        f"{date_str}T{time_str}{suffix}" if time_str else date_str,
+        _EVENT_DATETIME_FORMATS,
+    )
+    if parsed is None:
+        return None
+    return parsed, parsed.isoformat()
+
+
+# Returned by _parse_event() for events without a usable date.
+_NO_EVENT_TIME: Tuple[None, None] = (None, None)
+
+
+@register_carrier("mydhl")
+class MydhlMapper(CarrierMapperBase):
+    """
+    Mapper class for MYDHL carrier API responses to Universal Carrier Format.
+    """
+
+    __slots__ = ()
+
+    FIELD_MAPPING = _FIELD_MAPPING
+    STATUS_MAPPING = _STATUS
 
     def map_tracking_response(self, carrier_response: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -57,123 +307,153 @@ class MydhlMapper(CarrierMapperBase):
         Returns:
             Dict[str, Any]: Universal tracking response dictionary.
         """
-        universal: Dict[str, Any] = {}
+        return self._map_tracking(carrier_response, columnar=False)
 
-        try:
-            tracking_info = carrier_response.get("TrackingResponse", {})
-            awb_info_list = tracking_info.get("AWBInfo", {}).get(
-                "ArrayOfAWBInfoItem", []
-            )
-            if not awb_info_list:
-                return universal
-
-            # Process first AWBInfo item (assuming single tracking number)
-            awb_info = awb_info_list[0]
-
-            # Tracking Number
-            trk_num = awb_info.get("AWBNumber")
-            if trk_num:
-                universal[UniversalFieldNames.TRACKING_NUMBER] = trk_num
-
-            # Status
-            status_info = awb_info.get("Status", {})
-            action_status = status_info.get("ActionStatus")
-            if action_status:
-                universal[UniversalFieldNames.STATUS] = self.STATUS_MAPPING.get(
-                    action_status, action_status.lower()
-                )
+    def map_tracking_response_columnar(
+        self, carrier_response: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Maps MYDHL tracking response with events as columns instead of rows.
 
-            # Last Update - use latest event datetime if available
-            last_update = None
-            pieces = (
-                awb_info.get("Pieces", {})
-                .get("PieceInfo", {})
-                .get("ArrayOfPieceInfoItem", [])
-            )
-            if pieces:
-                last_event_dt = None
-                for piece in pieces:
-                    piece_events = piece.get("PieceEvent", {}).get(
-                        "ArrayOfPieceEventItem", []
-                    )
-                    for event in piece_events:
-                        dt = self._parse_event_datetime(event)
-                        if dt and (last_event_dt is None or dt > last_event_dt):
-                            last_event_dt = dt
-                if last_event_dt:
-                    last_update = last_event_dt.isoformat()
-            if not last_update:
-                # fallback to ShipmentInfo EstimatedDeliveryDate or None
-                shipment_info = awb_info.get("ShipmentInfo", {})
-                est_del = shipment_info.get("EstimatedDeliveryDate")
-                if est_del:
-                    last_update = self._parse_date(est_del)
-            if last_update:
-                universal[UniversalFieldNames.LAST_UPDATE] = last_update
-
-            # Current Location - use last event's ServiceArea Description or FacilityCode
-            current_location = None
-            if pieces:
-                last_event = None
-                last_event_dt = None
-                for piece in pieces:
-                    piece_events = piece.get("PieceEvent", {}).get(
-                        "ArrayOfPieceEventItem", []
-                    )
-                    for event in piece_events:
-                        dt = self._parse_event_datetime(event)
-                        if dt and (last_event_dt is None or dt > last_event_dt):
-                            last_event_dt = dt
-                            last_event = event
-                if last_event:
-                    service_area = last_event.get("ServiceArea", {})
-                    desc = service_area.get("Description")
-                    code = service_area.get("ServiceAreaCode")
-                    if desc:
-                        current_location = desc
-                    elif code:
-                        current_location = code
-            if current_location:
-                universal[UniversalFieldNames.CURRENT_LOCATION] = current_location
-
-            # Events - map all piece events to universal events list
-            events = []
+        Same output as map_tracking_response, except ``events`` is a dict of
+        equal-length lists keyed by the universal event field names (missing
+        values are None). Avoids one dict per event for bulk/serialized use.
+
+        Args:
+            carrier_response (Dict[str, Any]): Carrier-specific tracking response.
+
+        Returns:
+            Dict[str, Any]: Universal tracking response dictionary.
+        """
+        return self._map_tracking(carrier_response, columnar=True)
+
+    def _map_tracking(
+        self, carrier_response: Dict[str, Any], columnar: bool
+    ) -> Dict[str, Any]:
+        """Shared implementation of the row and columnar tracking mappings."""
+        universal: Dict[str, Any] = {}
+
+        awb_info_list = _dig(
+            carrier_response, "TrackingResponse", "AWBInfo", "ArrayOfAWBInfoItem"
+        )
+        if not awb_info_list or not isinstance(awb_info_list, list):
+            return universal
+
+        # Process first AWBInfo item (assuming single tracking number)
+        awb_info: _AWBInfo = awb_info_list[0]
+        if not isinstance(awb_info, dict):
+            return universal
+
+        # Tracking Number
+        trk_num = awb_info.get("AWBNumber")
+        if trk_num:
+            universal[UniversalFieldNames.TRACKING_NUMBER] = trk_num
+
+        # Status
+        action_status = _dig(awb_info, "Status", "ActionStatus")
+        if action_status and isinstance(action_status, str):
+            status = _STATUS_LOOKUP.get(action_status)
+            if status is None:
+                status = _normalise_status(action_status)
+            universal[UniversalFieldNames.STATUS] = status
+
+        last_update: Optional[str] = None
+        current_location: Optional[str] = None
+        events: Any = None
+        pieces: Sequence[Any] = (
+            _dig(awb_info, "Pieces", "PieceInfo", "ArrayOfPieceInfoItem") or ()
+        )
+        # Status-only responses ("not found", "pending") carry no pieces; skip
+        # the event scans entirely and go straight to the ShipmentInfo fallback.
+        if pieces:
+            # One pass over every piece event: track the latest event (for
+            # last update / current location) and collect the keyed events.
+            # Events are keyed by parsed datetime so ordering compares
+            # datetimes, not strings. DHL returns each piece's events (almost
+            # always) in chronological order, so sort per piece (a linear pass
+            # for an ordered run) and merge the K pieces instead of sorting
+            # all N events together.
+            last_event: Optional[_PieceEvent] = None
+            last_event_iso: Optional[str] = None
+            last_event_key: Optional[datetime] = None
+            per_piece_events: List[List[_KeyedEvent]] = []
+            parse_event = self._parse_event
+            event_values = self._event_values
             for piece in pieces:
-                piece_events = piece.get("PieceEvent", {}).get(
-                    "ArrayOfPieceEventItem", []
+                piece_events: Sequence[_PieceEvent] = (
+                    _dig(piece, "PieceEvent", "ArrayOfPieceEventItem") or ()
                 )
+                keyed_events: List[_KeyedEvent] = []
+                append_event = keyed_events.append
                 for event in piece_events:
-                    ev = self._map_event(event)
-                    if ev:
-                        events.append(ev)
-            if events:
-                # Sort events by datetime ascending
-                events.sort(
-                    key=lambda e: e.get(UniversalFieldNames.EVENT_DATETIME) or ""
+                    if not event or not isinstance(event, dict):
+                        continue
+                    dt, iso = parse_event(event) or _NO_EVENT_TIME
+                    key = _event_sort_key(dt)
+                    if dt and (last_event_key is None or key > last_event_key):
+                        last_event, last_event_iso, last_event_key = event, iso, key
+                    values = event_values(event, iso)
+                    if any(values):
+                        append_event((key, values))
+                if keyed_events:
+                    keyed_events.sort(key=itemgetter(0))
+                    per_piece_events.append(keyed_events)
+            # Merge pieces by datetime ascending (ties keep piece order)
+            rows = [
+                values
+                for _, values in heapq.merge(*per_piece_events, key=itemgetter(0))
+            ]
+            if rows and columnar:
+                # Transpose rows into one list per event field
+                events = dict(zip(_EVENT_KEYS, map(list, zip(*rows))))
+            elif rows:
+                events = [
+                    {key: value for key, value in zip(_EVENT_KEYS, values) if value}
+                    for values in rows
+                ]
+
+            # Last Update - use latest event datetime if available
+            if last_event_iso:
+                last_update = last_event_iso
+
+            # Current Location - use last event's ServiceArea Description or code
+            if last_event and isinstance(
+                service_area := last_event.get("ServiceArea"), dict
+            ):
+                current_location = service_area.get("Description") or service_area.get(
+                    "ServiceAreaCode"
                 )
-                universal[UniversalFieldNames.EVENTS] = events
 
-            # Estimated Delivery
-            est_del = awb_info.get("ShipmentInfo", {}).get("EstimatedDeliveryDate")
+        if not last_update:
+            # fallback to ShipmentInfo EstimatedDeliveryDate or None
+            est_del = _dig(awb_info, "ShipmentInfo", "EstimatedDeliveryDate")
             if est_del:
-                est_del_parsed = self._parse_date(est_del)
-                if est_del_parsed:
-                    universal[UniversalFieldNames.ESTIMATED_DELIVERY] = est_del_parsed
-
-            # Origin and Destination Country
-            shipment_info = awb_info.get("ShipmentInfo", {})
-            origin_area = shipment_info.get("OriginServiceArea", {})
-            dest_area = shipment_info.get("DestinationServiceArea", {})
-            origin_country = origin_area.get("ServiceAreaCode")
-            dest_country = dest_area.get("ServiceAreaCode")
-            if origin_country:
-                universal[UniversalFieldNames.ORIGIN_COUNTRY] = origin_country
-            if dest_country:
-                universal[UniversalFieldNames.DESTINATION_COUNTRY] = dest_country
-
-        except Exception:
-            # Fail silently and return what we have
-            pass
+                last_update = self._parse_date(est_del)
+        if last_update:
+            universal[UniversalFieldNames.LAST_UPDATE] = last_update
+        if current_location:
+            universal[UniversalFieldNames.CURRENT_LOCATION] = current_location
+        if events:
+            universal[UniversalFieldNames.EVENTS] = events
+
+        # Estimated Delivery
+        est_del = _dig(awb_info, "ShipmentInfo", "EstimatedDeliveryDate")
+        if est_del:
+            est_del_parsed = self._parse_date(est_del)
+            if est_del_parsed:
+                universal[UniversalFieldNames.ESTIMATED_DELIVERY] = est_del_parsed
+
+        # Origin and Destination Country
+        origin_country = _dig(
+            awb_info, "ShipmentInfo", "OriginServiceArea", "ServiceAreaCode"
+        )
+        dest_country = _dig(
+            awb_info, "ShipmentInfo", "DestinationServiceArea", "ServiceAreaCode"
+        )
+        if origin_country:
+            universal[UniversalFieldNames.ORIGIN_COUNTRY] = origin_country
+        if dest_country:
+            universal[UniversalFieldNames.DESTINATION_COUNTRY] = dest_country
 
         return universal
 
@@ -187,91 +467,113 @@ class MydhlMapper(CarrierMapperBase):
         Returns:
             Optional[str]: ISO 8601 date string or None if parsing fails.
         """
-        if not date_str:
+        if not date_str or not isinstance(date_str, str):
             return None
-        for fmt in ("%Y-%m-%d", "%Y%m%d", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.isoformat()
-            except (ValueError, TypeError):
-                continue
-        return None
+        return _parse_date_cached(date_str)
 
-    def _parse_event_datetime(self, event: Dict[str, Any]) -> Optional[datetime]:
+    def _parse_event_datetime(self, event: _PieceEvent) -> Optional[datetime]:
         """
         Parses event date and time with optional GMT offset into datetime object.
 
         Args:
-            event (Dict[str, Any]): Event dictionary containing Date, Time, GMTOffset.
+            event (_PieceEvent): Event dictionary containing Date, Time, GMTOffset.
 
         Returns:
             Optional[datetime]: Parsed datetime or None.
         """
+        parsed = self._parse_event(event)
+        return parsed[0] if parsed else None
+
+    def _parse_event(self, event: _PieceEvent) -> Optional[_EventTime]:
+        """
+        Parses event date/time/offset into a datetime and its ISO 8601 string.
+
+        Args:
+            event (_PieceEvent): Event dictionary containing Date, Time, GMTOffset.
+
+        Returns:
+            Optional[_EventTime]: (datetime, ISO string) or None.
+        """
+        if not isinstance(event, dict):
+            return None
         date_str = event.get("Date")
         time_str = event.get("Time")
         gmt_offset = event.get("GMTOffset")
 
-        if not date_str:
+        if not date_str or not isinstance(date_str, str):
+            return None
+        if (time_str and not isinstance(time_str, str)) or (
+            gmt_offset and not isinstance(gmt_offset, str)
+        ):
             return None
 
-        dt_str = date_str
-        if time_str:
-            dt_str += "T" + time_str
-        if gmt_offset:
-            # Normalize GMT offset format if needed
-            offset = gmt_offset.strip()
-            if offset.startswith("+") or offset.startswith("-"):
-                dt_str += offset
-            else:
-                dt_str += "+" + offset
-
-        # Try parsing with timezone
-        for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(dt_str, fmt)
-            except (ValueError, TypeError):
-                continue
-        return None
+        # Date/Time/GMTOffset triples repeat across pieces (the same scan is
+        # reported per piece), so the parse itself is memoised.
+        return _parse_event_dt_cached(date_str, time_str or None, gmt_offset or None)
 
-    def _map_event(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _map_event(self, event: _PieceEvent) -> Optional[Dict[str, Any]]:
         """
         Maps a single piece event to universal event format.
 
         Args:
-            event (Dict[str, Any]): Carrier event dictionary.
+            event (_PieceEvent): Carrier event dictionary.
 
         Returns:
             Optional[Dict[str, Any]]: Universal event dictionary or None.
         """
         if not event:
             return None
+        _, iso = self._parse_event(event) or _NO_EVENT_TIME
+        return self._build_event(event, iso)
+
+    def _build_event(
+        self, event: _PieceEvent, event_datetime: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Builds the universal event dictionary for an already-parsed event time.
 
-        ev: Dict[str, Any] = {}
-
-        # Event datetime
-        dt = self._parse_event_datetime(event)
-        if dt:
-            ev[UniversalFieldNames.EVENT_DATETIME] = dt.isoformat()
-
-        # Event type and description
-        service_event = event.get("ServiceEvent", {})
-        event_code = service_event.get("EventCode")
-        description = service_event.get("Description")
-        if event_code:
-            ev[UniversalFieldNames.EVENT_TYPE] = event_code
-        if description:
-            ev[UniversalFieldNames.EVENT_DESCRIPTION] = description
-
-        # Event location
-        service_area = event.get("ServiceArea", {})
-        location_desc = service_area.get("Description")
-        location_code = service_area.get("ServiceAreaCode")
-        if location_desc:
-            ev[UniversalFieldNames.EVENT_LOCATION] = location_desc
-        elif location_code:
-            ev[UniversalFieldNames.EVENT_LOCATION] = location_code
-
-        return ev
+        Args:
+            event (_PieceEvent): Carrier event dictionary.
+            event_datetime (Optional[str]): ISO 8601 string from _parse_event.
+
+        Returns:
+            Dict[str, Any]: Universal event dictionary (may be empty).
+        """
+        # Keep only present values
+        return {
+            key: value
+            for key, value in zip(
+                _EVENT_KEYS, self._event_values(event, event_datetime)
+            )
+            if value
+        }
+
+    def _event_values(
+        self, event: _PieceEvent, event_datetime: Optional[str]
+    ) -> _EventValues:
+        """
+        Extracts a piece event's universal values in _EVENT_KEYS order.
+
+        Args:
+            event (_PieceEvent): Carrier event dictionary.
+            event_datetime (Optional[str]): ISO 8601 string from _parse_event.
+
+        Returns:
+            _EventValues: (datetime, type, description, location); None if absent.
+        """
+        event_type = description = location = None
+        # Each nested object is fetched once and only read if it is a dict.
+        if isinstance(service_event := event.get("ServiceEvent"), dict):
+            event_type = service_event.get("EventCode") or None
+            description = service_event.get("Description") or None
+        if isinstance(service_area := event.get("ServiceArea"), dict):
+            # Location prefers the ServiceArea description over its code.
+            location = (
+                service_area.get("Description")
+                or service_area.get("ServiceAreaCode")
+                or None
+            )
+        return event_datetime, event_type, description, location
 
     def map_carrier_schema(
         self, carrier_schema: Dict[str, Any]
@@ -1,43 +1,196 @@
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import re
+import sys
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..core import UniversalFieldNames
 from ..core.schema import UniversalCarrierFormat
-
-
-class MydhlApiMapper:
+from .base import CarrierMapperBase
+
+# Lookup tables shared by every instance (the class attributes alias them).
+_FIELD_MAPPING: Dict[str, str] = {
+    "AWBNumber": UniversalFieldNames.TRACKING_NUMBER,
+    "Status.ActionStatus": UniversalFieldNames.STATUS,
+    "ShipmentInfo.ShipperName": UniversalFieldNames.CURRENT_LOCATION,
+    "ShipmentInfo.ShipmentDate": UniversalFieldNames.LAST_UPDATE,
+    "ShipmentInfo.DestinationServiceArea.Description": UniversalFieldNames.CITY,
+    "ShipmentInfo.DestinationServiceArea.ServiceAreaCode": UniversalFieldNames.POSTAL_CODE,
+    "ShipmentInfo.DestinationServiceArea.CountryCode": UniversalFieldNames.DESTINATION_COUNTRY,
+    "ShipmentInfo.OriginServiceArea.ServiceAreaCode": UniversalFieldNames.POSTAL_CODE,  # Origin postal code
+    "ShipmentInfo.OriginServiceArea.CountryCode": UniversalFieldNames.ORIGIN_COUNTRY,
+    "LabelImage.GraphicImage": UniversalFieldNames.LABEL_BASE64,
+    "ShipmentIdentificationNumber": UniversalFieldNames.SHIPMENT_NUMBER,
+    "Service.ServiceName": UniversalFieldNames.SERVICE_NAME,
+    "TotalNet.Amount": UniversalFieldNames.COST,
+    "TotalNet.Currency": UniversalFieldNames.CURRENCY,
+}
+
+_STATUS_MAPPING: Dict[str, str] = {
+    "DELIVERED": "delivered",
+    "IN_TRANSIT": "in_transit",
+    "EXCEPTION": "exception",
+    "PENDING": "pending",
+    "INFO_RECEIVED": "info_received",
+    "OUT_FOR_DELIVERY": "out_for_delivery",
+    "FAILED_ATTEMPT": "failed_attempt",
+    "CANCELLED": "cancelled",
+    "RETURNED": "returned",
+}
+_STATUS_GET = _STATUS_MAPPING.get
+# Every casing the API is seen to send, so the hot path is one lookup with no
+# upper()/lower() string allocation; other casings fall back to upper().
+_STATUS_NORMALIZED: Dict[str, str] = {
+    variant: status
+    for raw, status in _STATUS_MAPPING.items()
+    for variant in (raw, raw.lower(), raw.title())
+}
+
+
+def _path(*keys: str) -> Tuple[str, ...]:
+    """Build a key path of interned strings (identity-fast dict lookups)."""
+    return tuple(sys.intern(key) for key in keys)
+
+
+# Nested key paths walked on every response, resolved once at import instead
+# of being spelled out as chained .get(..., {}) calls.
+_ACTION_STATUS_PATH = _path("Status", "ActionStatus")
+# Relative to ShipmentInfo
+_SHIPMENT_EVENT_ITEMS_PATH = _path("ShipmentEvent", "ArrayOfShipmentEventItem")
+_DESTINATION_AREA_PATH = _path("DestinationServiceArea", "Description")
+# Relative to a shipment event
+_EVENT_DESCRIPTION_PATH = _path("ServiceEvent", "Description")
+_EVENT_CODE_PATH = _path("ServiceEvent", "EventCode")
+_EVENT_AREA_PATH = _path("ServiceArea", "Description")
+
+
+def _walk(data: Any, path: Tuple[str, ...]) -> Any:
+    """Follow a key path through nested dicts; None if any step is missing."""
+    # Subscript and let the rare miss raise: cheaper than a type check plus
+    # .get() per step when the keys are present (the common case).
+    try:
+        for key in path:
+            data = data[key]
+    except (KeyError, TypeError):
+        return None
+    return data
+
+
+# "+0100" -> "+01:00" for every whole, half and three-quarter hour offset.
+_OFFSET_NORMALIZE: Dict[str, str] = {
+    f"{sign}{hours:02d}{minutes:02d}": f"{sign}{hours:02d}:{minutes:02d}"
+    for sign in "+-"
+    for hours in range(15)
+    for minutes in (0, 30, 45)
+}
+
+
+# Field widths strptime's %Y-%m-%d / %H:%M[:%S] accept: a 4-digit year and
+# 1-2 digit month, day, hour, minute and second.
+_LOOSE_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+_LOOSE_TIME_RE = re.compile(r"([0-9]{1,2}):([0-9]{1,2})(?::([0-9]{1,2}))?")
+
+
+def _match_ints(pattern: "re.Pattern[str]", text: str) -> Optional[Tuple[int, ...]]:
+    """Fullmatch text against pattern and return its present groups as ints."""
+    match = pattern.fullmatch(text)
+    if match is None:
+        return None
+    return tuple(int(group) for group in match.groups() if group is not None)
+
+
+# Parsing cores are free functions so lru_cache keys on the strings alone (no
+# self) and the cache is shared by every mapper instance. The same
+# (date, time, offset) triple is parsed once per distinct value.
+@lru_cache(maxsize=4096)
+def _parse_event_datetime_cached(
+    date_str: str, time_str: Optional[str], gmt_offset: Optional[str]
+) -> Optional[str]:
+    """See MydhlApiMapper._parse_event_datetime."""
+    if gmt_offset:
+        # Normalize offset format if needed (e.g. +0100 to +01:00); real-world
+        # offsets come from a small set, so most are a single table lookup.
+        normalized = _OFFSET_NORMALIZE.get(gmt_offset)
+        if normalized is not None:
+            gmt_offset = normalized
+        elif len(gmt_offset) == 5 and (gmt_offset[3] != ":"):
+            gmt_offset = gmt_offset[:3] + ":" + gmt_offset[3:]
+    else:
+        gmt_offset = ""
+    if time_str and len(time_str) == 5 and time_str[2] == ":":
+        time_str += ":00"  # HH:MM -> HH:MM:SS
+
+    # Fast path: canonical YYYY-MM-DD and HH:MM:SS are already the ISO form, so
+    # validate them with one C-level parse and format with a single f-string.
+    if (
+        len(date_str) == 10
+        and date_str[4] == "-" == date_str[7]
+        and (not time_str or (len(time_str) == 8 and time_str[2] == ":" == time_str[5]))
+    ):
+        iso_str = f"{date_str}T{time_str or '00:00:00'}"
+        try:
+            datetime.fromisoformat(iso_str)
+            return iso_str + gmt_offset
+        except ValueError:
+            pass  # e.g. "2026-01- 5": let the checks below decide
+
+    # Non-canonical shapes (unpadded fields, e.g. "2026-1-5" / "9:30"):
+    # split into integers and let the datetime constructor validate them.
+    date_parts = _match_ints(_LOOSE_DATE_RE, date_str)
+    time_parts = _match_ints(_LOOSE_TIME_RE, time_str) if time_str else (0, 0)
+    try:
+        if date_parts is None or time_parts is None:
+            # Rarer shapes strptime also takes (e.g. extra whitespace)
+            if time_str:
+                if len(time_str.split(":")) == 2:
+                    time_str += ":00"
+                dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
+            else:
+                dt = datetime.strptime(date_str, "%Y-%m-%d")
+        else:
+            year, month, day = date_parts
+            hour, minute, second = (*time_parts, 0)[:3]
+            dt = datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return None
+    # Append GMT offset if present
+    return dt.isoformat() + gmt_offset
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """See MydhlApiMapper._parse_date."""
+    try:
+        # Canonical YYYY-MM-DD is already its own ISO form: validate it with
+        # the date constructor and return the input, skipping strptime.
+        if (
+            len(date_str) == 10
+            and date_str[4] == "-" == date_str[7]
+            and date_str[:4].isdigit()
+            and date_str[5:7].isdigit()
+            and date_str[8:].isdigit()
+        ):
+            date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+            return date_str
+        date_parts = _match_ints(_LOOSE_DATE_RE, date_str)
+        if date_parts is None:
+            # Rarer shapes strptime also takes (e.g. a space-padded day)
+            return datetime.strptime(date_str, "%Y-%m-%d").date().isoformat()
+        year, month, day = date_parts
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return None
+
+
+class MydhlApiMapper(CarrierMapperBase):
     """
     Mapper class for MYDHL API responses to Universal Carrier Format.
     """
 
-    FIELD_MAPPING = {
-        "AWBNumber": UniversalFieldNames.TRACKING_NUMBER,
-        "Status.ActionStatus": UniversalFieldNames.STATUS,
-        "ShipmentInfo.ShipperName": UniversalFieldNames.CURRENT_LOCATION,
-        "ShipmentInfo.ShipmentDate": UniversalFieldNames.LAST_UPDATE,
-        "ShipmentInfo.DestinationServiceArea.Description": UniversalFieldNames.CITY,
-        "ShipmentInfo.DestinationServiceArea.ServiceAreaCode": UniversalFieldNames.POSTAL_CODE,
-        "ShipmentInfo.DestinationServiceArea.CountryCode": UniversalFieldNames.DESTINATION_COUNTRY,
-        "ShipmentInfo.OriginServiceArea.ServiceAreaCode": UniversalFieldNames.POSTAL_CODE,  # Origin postal code
-        "ShipmentInfo.OriginServiceArea.CountryCode": UniversalFieldNames.ORIGIN_COUNTRY,
-        "LabelImage.GraphicImage": UniversalFieldNames.LABEL_BASE64,
-        "ShipmentIdentificationNumber": UniversalFieldNames.SHIPMENT_NUMBER,
-        "Service.ServiceName": UniversalFieldNames.SERVICE_NAME,
-        "TotalNet.Amount": UniversalFieldNames.COST,
-        "TotalNet.Currency": UniversalFieldNames.CURRENCY,
-    }
-
-    STATUS_MAPPING = {
-        "DELIVERED": "delivered",
-        "IN_TRANSIT": "in_transit",
-        "EXCEPTION": "exception",
-        "PENDING": "pending",
-        "INFO_RECEIVED": "info_received",
-        "OUT_FOR_DELIVERY": "out_for_delivery",
-        "FAILED_ATTEMPT": "failed_attempt",
-        "CANCELLED": "cancelled",
-        "RETURNED": "returned",
-    }
+    __slots__ = ()
+
+    FIELD_MAPPING = _FIELD_MAPPING
+    STATUS_MAPPING = _STATUS_MAPPING
 
     def map_tracking_response(self, carrier_response: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -51,137 +204,106 @@ class MydhlApiMapper:
         """
         universal_response: Dict[str, Any] = {}
 
+        # A missing or malformed envelope is one unified miss; further down,
+        # malformed values are handled field by field so that whatever is
+        # well-formed still gets mapped.
         try:
-            awb_info_list = (
-                carrier_response.get("TrackingResponse", {})
-                .get("AWBInfo", {})
-                .get("ArrayOfAWBInfoItem", [])
+            # Assuming single AWB per request
+            awb_info = carrier_response["TrackingResponse"]["AWBInfo"][
+                "ArrayOfAWBInfoItem"
+            ][0]
+        except (KeyError, IndexError, TypeError):
+            return universal_response
+        if not isinstance(awb_info, dict):
+            return universal_response
+
+        # Map tracking number
+        tracking_number = awb_info.get("AWBNumber")
+        if tracking_number:
+            universal_response[UniversalFieldNames.TRACKING_NUMBER] = tracking_number
+
+        # Map status
+        status = _walk(awb_info, _ACTION_STATUS_PATH)
+        if status and isinstance(status, str):
+            universal_response[UniversalFieldNames.STATUS] = _STATUS_NORMALIZED.get(
+                status
+            ) or _STATUS_GET(status.upper(), status.lower())
+
+        shipment_info = awb_info.get("ShipmentInfo")
+        if not isinstance(shipment_info, dict):
+            shipment_info = {}
+        shipment_events = _walk(shipment_info, _SHIPMENT_EVENT_ITEMS_PATH)
+        if not isinstance(shipment_events, list):
+            shipment_events = []
+
+        # One pass over the shipment events: parse each datetime once,
+        # build the events history and track the latest event (the first
+        # event with the greatest date and time). The history is preallocated
+        # to the event count and trimmed afterwards (no append regrowth).
+        events: List[Any] = [None] * len(shipment_events)
+        mapped = 0
+        last_event = None
+        last_update = None
+        parse_event_datetime = self._parse_event_datetime
+        for event in shipment_events:
+            if not isinstance(event, dict):
+                continue
+            event_datetime = parse_event_datetime(
+                event.get("Date"), event.get("Time"), event.get("GMTOffset")
             )
-            if not awb_info_list:
-                return universal_response
-
-            awb_info = awb_info_list[0]  # Assuming single AWB per request
-
-            # Map tracking number
-            tracking_number = awb_info.get("AWBNumber")
-            if tracking_number:
-                universal_response[UniversalFieldNames.TRACKING_NUMBER] = (
-                    tracking_number
+            if event_datetime and (last_update is None or event_datetime > last_update):
+                last_update = event_datetime
+                last_event = event
+            event_desc = _walk(event, _EVENT_DESCRIPTION_PATH)
+            event_location = _walk(event, _EVENT_AREA_PATH)
+            event_type = _walk(event, _EVENT_CODE_PATH)
+            if event_datetime or event_desc or event_location or event_type:
+                events[mapped] = {
+                    UniversalFieldNames.EVENT_DATETIME: event_datetime,
+                    UniversalFieldNames.EVENT_DESCRIPTION: event_desc,
+                    UniversalFieldNames.EVENT_LOCATION: event_location,
+                    UniversalFieldNames.EVENT_TYPE: event_type,
+                }
+                mapped += 1
+        del events[mapped:]
+
+        # Map last update datetime from latest shipment event if available
+        if last_update:
+            universal_response[UniversalFieldNames.LAST_UPDATE] = last_update
+
+        # Map current location from latest event's ServiceArea Description or ShipmentInfo DestinationServiceArea Description
+        current_location = None
+        if last_event:
+            current_location = _walk(last_event, _EVENT_AREA_PATH)
+        if not current_location:
+            current_location = _walk(shipment_info, _DESTINATION_AREA_PATH)
+        if current_location:
+            universal_response[UniversalFieldNames.CURRENT_LOCATION] = current_location
+
+        # Map estimated delivery date
+        est_delivery = shipment_info.get("EstimatedDeliveryDate")
+        if est_delivery:
+            est_delivery_dt = self._parse_date(est_delivery)
+            if est_delivery_dt:
+                universal_response[UniversalFieldNames.ESTIMATED_DELIVERY] = (
+                    est_delivery_dt
                 )
 
-            # Map status
-            status = awb_info.get("Status", {}).get("ActionStatus")
-            if status:
-                universal_response[UniversalFieldNames.STATUS] = (
-                    self.STATUS_MAPPING.get(status.upper(), status.lower())
-                )
+        # Map events history
+        if events:
+            universal_response[UniversalFieldNames.EVENTS] = events
 
-            # Map last update datetime from latest shipment event if available
-            shipment_events = (
-                awb_info.get("ShipmentInfo", {})
-                .get("ShipmentEvent", {})
-                .get("ArrayOfShipmentEventItem", [])
-            )
-            last_update = None
-            if shipment_events:
-                # Find the latest event by date and time
-                last_event = self._get_latest_event(shipment_events)
-                if last_event:
-                    last_update = self._parse_event_datetime(
-                        last_event.get("Date"),
-                        last_event.get("Time"),
-                        last_event.get("GMTOffset"),
-                    )
-            if last_update:
-                universal_response[UniversalFieldNames.LAST_UPDATE] = last_update
-
-            # Map current location from latest event's ServiceArea Description or ShipmentInfo DestinationServiceArea Description
-            current_location = None
-            if shipment_events:
-                last_event = self._get_latest_event(shipment_events)
-                if last_event:
-                    service_area = last_event.get("ServiceArea", {})
-                    current_location = service_area.get("Description")
-            if not current_location:
-                current_location = (
-                    awb_info.get("ShipmentInfo", {})
-                    .get("DestinationServiceArea", {})
-                    .get("Description")
-                )
-            if current_location:
-                universal_response[UniversalFieldNames.CURRENT_LOCATION] = (
-                    current_location
-                )
+        # Map signed by if available (from last event's Signatory)
+        if last_event:
+            signed_by = last_event.get("Signatory")
+            if signed_by:
+                universal_response[UniversalFieldNames.SIGNED_BY] = signed_by
 
-            # Map estimated delivery date
-            est_delivery = awb_info.get("ShipmentInfo", {}).get("EstimatedDeliveryDate")
-            if est_delivery:
-                est_delivery_dt = self._parse_date(est_delivery)
-                if est_delivery_dt:
-                    universal_response[UniversalFieldNames.ESTIMATED_DELIVERY] = (
-                        est_delivery_dt
-                    )
-
-            # Map events history
-            events = []
-            for event in shipment_events:
-                event_datetime = self._parse_event_datetime(
-                    event.get("Date"), event.get("Time"), event.get("GMTOffset")
-                )
-                event_desc = event.get("ServiceEvent", {}).get("Description")
-                event_location = event.get("ServiceArea", {}).get("Description")
-                event_type = event.get("ServiceEvent", {}).get("EventCode")
-                if event_datetime or event_desc or event_location or event_type:
-                    events.append(
-                        {
-                            UniversalFieldNames.EVENT_DATETIME: event_datetime,
-                            UniversalFieldNames.EVENT_DESCRIPTION: event_desc,
-                            UniversalFieldNames.EVENT_LOCATION: event_location,
-                            UniversalFieldNames.EVENT_TYPE: event_type,
-                        }
-                    )
-            if events:
-                universal_response[UniversalFieldNames.EVENTS] = events
-
-            # Map signed by if available (from last event's Signatory)
-            if shipment_events:
-                last_event = self._get_latest_event(shipment_events)
-                signed_by = last_event.get("Signatory")
-                if signed_by:
-                    universal_response[UniversalFieldNames.SIGNED_BY] = signed_by
-
-            # Map proof of delivery if available (base64 image from DocumentImageResponse or ePOD)
-            # This requires separate call, so not mapped here.
-
-        except (KeyError, TypeError, ValueError):
-            # Fail silently and return what is mapped so far
-            pass
+        # Map proof of delivery if available (base64 image from DocumentImageResponse or ePOD)
+        # This requires separate call, so not mapped here.
 
         return universal_response
 
-    def _get_latest_event(
-        self, events: List[Dict[str, Any]]
-    ) -> Optional[Dict[str, Any]]:
-        """
-        Returns the latest event from a list of events based on Date and Time.
-
-        Args:
-            events (List[Dict[str, Any]]): List of event dictionaries.
-
-        Returns:
-            Optional[Dict[str, Any]]: The latest event dictionary or None.
-        """
-        latest_event = None
-        latest_dt = None
-        for event in events:
-            dt = self._parse_event_datetime(
-                event.get("Date"), event.get("Time"), event.get("GMTOffset")
-            )
-            if dt and (latest_dt is None or dt > latest_dt):
-                latest_dt = dt
-                latest_event = event
-        return latest_event
-
     def _parse_event_datetime(
         self,
         date_str: Optional[str],
@@ -199,29 +321,14 @@ class MydhlApiMapper:
         Returns:
             Optional[str]: ISO 8601 formatted datetime string or None if parsing fails.
         """
-        if not date_str:
+        if not date_str or not isinstance(date_str, str):
             return None
-        try:
-            if time_str:
-                # Normalize time string to HH:MM:SS if needed
-                if len(time_str.split(":")) == 2:
-                    time_str += ":00"
-                dt_str = f"{date_str} {time_str}"
-                dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
-            else:
-                dt = datetime.strptime(date_str, "%Y-%m-%d")
-
-            # Append GMT offset if present
-            if gmt_offset:
-                # Normalize offset format if needed (e.g. +0100 to +01:00)
-                if len(gmt_offset) == 5 and (gmt_offset[3] != ":"):
-                    gmt_offset = gmt_offset[:3] + ":" + gmt_offset[3:]
-                iso_str = dt.isoformat() + gmt_offset
-            else:
-                iso_str = dt.isoformat()
-            return iso_str
-        except (ValueError, TypeError):
+        # Only strings are cached; other junk values are unparseable anyway.
+        if (time_str is not None and not isinstance(time_str, str)) or (
+            gmt_offset is not None and not isinstance(gmt_offset, str)
+        ):
             return None
+        return _parse_event_datetime_cached(date_str, time_str, gmt_offset)
 
     def _parse_date(self, date_str: str) -> Optional[str]:
         """
@@ -233,11 +340,9 @@ class MydhlApiMapper:
         Returns:
             Optional[str]: ISO 8601 date string or None if parsing fails.
         """
-        try:
-            dt = datetime.strptime(date_str, "%Y-%m-%d")
-            return dt.date().isoformat()
-        except (ValueError, TypeError):
+        if not isinstance(date_str, str):
             return None
+        return _parse_date_cached(date_str)
 
     def map_carrier_schema(
         self, carrier_schema: Dict[str, Any]
@@ -18,7 +18,8 @@ NOTE: This is a reference example - not a production mapper for a specific carri
 Use as a template when creating new mappers or as a reference for the mapper generator.
 """
 
-from datetime import datetime
+import re
+from datetime import date, datetime
 from typing import Any, Dict
 
 from ..core import UniversalFieldNames
@@ -33,6 +34,17 @@ from ..core.schema import (
 from .base import CarrierMapperBase
 from .registry import register_carrier
 
+# US ZIP codes: 5 digits or 5+4 format (dashes ignored, e.g. 12345-6789)
+_US_ZIP = re.compile(r"-*(?:\d-*){5}(?:(?:\d-*){4})?")
+
+# Schema lookups for _map_endpoints; anything else falls back to GET / STRING
+_HTTP_METHODS: Dict[str, HttpMethod] = dict(HttpMethod.__members__)
+_PARAMETER_TYPES: Dict[str, ParameterType] = {
+    "integer": ParameterType.INTEGER,
+    "number": ParameterType.NUMBER,
+    "boolean": ParameterType.BOOLEAN,
+}
+
 
 @register_carrier("example")
 class ExampleMapper(CarrierMapperBase):
@@ -47,6 +59,8 @@ class ExampleMapper(CarrierMapperBase):
         universal_format = mapper.map_tracking_response(carrier_response)
     """
 
+    __slots__ = ()
+
     # Field name mappings: Carrier field → Universal field (using constants for type safety)
     FIELD_MAPPING = {
         "trk_num": UniversalFieldNames.TRACKING_NUMBER,
@@ -90,8 +104,9 @@ class ExampleMapper(CarrierMapperBase):
         # Map and normalize status
         if "stat" in carrier_response:
             carrier_status = carrier_response["stat"]
-            universal_response[UniversalFieldNames.STATUS] = self.STATUS_MAPPING.get(
-                carrier_status, carrier_status.lower()
+            # Only lowercase (allocate) on a miss, not as an eager .get default
+            universal_response[UniversalFieldNames.STATUS] = (
+                self.STATUS_MAPPING.get(carrier_status) or carrier_status.lower()
             )
 
         # Map location
@@ -102,16 +117,15 @@ class ExampleMapper(CarrierMapperBase):
             if "city" in location:
                 universal_location[UniversalFieldNames.CITY] = location["city"]
 
-            if "postcode" in location:
-                universal_location[UniversalFieldNames.POSTAL_CODE] = location[
-                    "postcode"
-                ]
+            postcode = location.get("postcode")
+            if postcode is not None:
+                universal_location[UniversalFieldNames.POSTAL_CODE] = postcode
 
-            # Derive country from postcode if missing
-            if "country" not in location and "postcode" in location:
-                universal_location[UniversalFieldNames.COUNTRY] = (
-                    self._derive_country_from_postcode(location["postcode"])
-                )
+                # Derive country from postcode if missing
+                if "country" not in location:
+                    universal_location[UniversalFieldNames.COUNTRY] = (
+                        self._derive_country_from_postcode(postcode)
+                    )
 
             if universal_location:
                 universal_response[UniversalFieldNames.CURRENT_LOCATION] = (
@@ -123,10 +137,15 @@ class ExampleMapper(CarrierMapperBase):
             # Normalize date format (carrier uses YYYY-MM-DD, we want ISO 8601)
             est_del = carrier_response["est_del"]
             try:
-                # Try to parse and format as ISO 8601
-                dt = datetime.strptime(est_del, "%Y-%m-%d")
+                # Zero-padded YYYY-MM-DD goes to the C-level ISO parser; other
+                # shapes (e.g. "2026-1-5") keep the strptime parse, as
+                # fromisoformat accepts more (week dates, ...) on newer Pythons
+                if len(est_del) == 10 and est_del[4] == est_del[7] == "-":
+                    est_date = date.fromisoformat(est_del)
+                else:
+                    est_date = datetime.strptime(est_del, "%Y-%m-%d").date()
                 universal_response[UniversalFieldNames.ESTIMATED_DELIVERY] = (
-                    dt.isoformat() + "Z"
+                    est_date.isoformat() + "T00:00:00Z"
                 )
             except ValueError:
                 # If parsing fails, use as-is
@@ -147,18 +166,11 @@ class ExampleMapper(CarrierMapperBase):
         Returns:
             str: ISO country code (e.g., "GB", "US")
         """
-        # UK postcodes: alphanumeric pattern like SW1A 1AA, M1 1AA
-        if len(postcode) >= 5 and postcode[0].isalpha():
-            return "GB"
-
-        # US ZIP codes: 5 digits or 5+4 format
-        if postcode.replace("-", "").isdigit() and len(postcode.replace("-", "")) in [
-            5,
-            9,
-        ]:
+        # US ZIP codes: one precompiled match, no stripped copies of the string
+        if _US_ZIP.fullmatch(postcode):
             return "US"
 
-        # Default to GB for UK-style postcodes
+        # UK postcodes (SW1A 1AA, M1 1AA) and anything else default to GB
         return "GB"
 
     def map_carrier_schema(
@@ -192,28 +204,21 @@ class ExampleMapper(CarrierMapperBase):
 
         for endpoint in carrier_endpoints:
             # Map HTTP method
-            method_str = endpoint.get("method", "GET").upper()
-            try:
-                method = HttpMethod[method_str]
-            except KeyError:
-                method = HttpMethod.GET
+            method = _HTTP_METHODS.get(
+                endpoint.get("method", "GET").upper(), HttpMethod.GET
+            )
 
             # Map path
             path = endpoint.get("path", "")
-            if not path.startswith("/"):
-                path = f"/{path}"
+            if path[:1] != "/":
+                path = "/" + path
 
             # Map parameters
             parameters = []
             for param in endpoint.get("params", []):
-                param_type_str = param.get("type", "string").lower()
-                param_type = ParameterType.STRING
-                if param_type_str == "integer":
-                    param_type = ParameterType.INTEGER
-                elif param_type_str == "number":
-                    param_type = ParameterType.NUMBER
-                elif param_type_str == "boolean":
-                    param_type = ParameterType.BOOLEAN
+                param_type = _PARAMETER_TYPES.get(
+                    param.get("type", "string").lower(), ParameterType.STRING
+                )
 
                 parameters.append(
                     Parameter(
@@ -23,6 +23,8 @@ class ExampleTemplateMapper(CarrierMapperBase):
     Template showing the structure of a mapper. Not fully implemented.
     """
 
+    __slots__ = ()
+
     def map_tracking_response(self, carrier_response: Dict[str, Any]) -> Dict[str, Any]:
         """Stub: template does not implement tracking response mapping."""
         return {}
@@ -5,6 +5,7 @@ Mappers register themselves by slug (e.g. "example", "dhl"). The core
 and API use the registry to get a mapper by name instead of hardcoding.
 """
 
+import sys
 from typing import List, Type
 
 from .base import CarrierMapperBase
@@ -15,11 +16,14 @@ class CarrierRegistry:
     Registry of carrier mappers by slug.
 
     Use register() to add a mapper, get() to obtain an instance by slug.
+    Mappers are stateless, so get_instance() returns one shared instance per
+    slug for hot paths (e.g. the API) instead of constructing per request.
     Contributing a new carrier = add a mapper class + one register() call
     (or @register_carrier("slug") on the class); no changes to core or API.
     """
 
     _mappers: dict[str, Type[CarrierMapperBase]] = {}
+    _instances: dict[str, CarrierMapperBase] = {}
 
     @classmethod
     def register(cls, slug: str, mapper_class: Type[CarrierMapperBase]) -> None:
@@ -28,21 +32,53 @@ class CarrierRegistry:
             raise TypeError(
                 f"Mapper must be a subclass of CarrierMapperBase, got {mapper_class}"
             )
-        cls._mappers[slug.lower().strip()] = mapper_class
+        key = sys.intern(slug.lower().strip())
+        cls._mappers[key] = mapper_class
+        cls._instances.pop(key, None)
 
     @classmethod
-    def get(cls, slug: str) -> CarrierMapperBase:
+    def get_class(cls, slug: str) -> Type[CarrierMapperBase]:
         """
-        Return a new mapper instance for the given slug.
+        Return the mapper class registered for the given slug.
 
         Raises:
             KeyError: If slug is not registered.
         """
+        # Registered keys are normalized, so an exact hit needs no lower/strip
+        mapper_class = cls._mappers.get(slug)
+        if mapper_class is not None:
+            return mapper_class
         key = slug.lower().strip()
         if key not in cls._mappers:
             available = ", ".join(sorted(cls._mappers.keys())) or "(none)"
             raise KeyError(f"Unknown carrier: {slug!r}. Registered: {available}")
-        return cls._mappers[key]()
+        return cls._mappers[key]
+
+    @classmethod
+    def get(cls, slug: str) -> CarrierMapperBase:
+        """
+        Return a new mapper instance for the given slug.
+
+        Raises:
+            KeyError: If slug is not registered.
+        """
+        return cls.get_class(slug)()
+
+    @classmethod
+    def get_instance(cls, slug: str) -> CarrierMapperBase:
+        """
+        Return the shared mapper instance for the given slug (created on first use).
+
+        Raises:
+            KeyError: If slug is not registered.
+        """
+        instance = cls._instances.get(slug)
+        if instance is None:
+            key = slug.lower().strip()
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls._instances[key] = cls.get_class(key)()
+        return instance
 
     @classmethod
     def list_names(cls) -> List[str]:
@@ -52,7 +88,7 @@ class CarrierRegistry:
     @classmethod
     def is_registered(cls, slug: str) -> bool:
         """Return True if slug is registered."""
-        return slug.lower().strip() in cls._mappers
+        return slug in cls._mappers or slug.lower().strip() in cls._mappers
 
 
 def register_carrier(slug: str):
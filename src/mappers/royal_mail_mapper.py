@@ -1,20 +1,18 @@
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Pattern, Tuple
 
 from ..core import UniversalFieldNames
 from ..core.schema import UniversalCarrierFormat
 from .base import CarrierMapperBase
 from .registry import register_carrier
 
-
-@register_carrier("royal_mail")
-@register_carrier("royalmail")
-class RoyalMailRestApiMapper(CarrierMapperBase):
-    """
-    Mapper class for Royal Mail Rest API responses to Universal Carrier Format.
-    """
-
-    FIELD_MAPPING = {
+# Read-only lookup tables shared by every instance; the class attributes below
+# alias them for documentation / codegen.
+_FIELD_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
         "trackingNumber": UniversalFieldNames.TRACKING_NUMBER,
         "status": UniversalFieldNames.STATUS,
         "lastUpdate": UniversalFieldNames.LAST_UPDATE,
@@ -49,8 +47,10 @@ class RoyalMailRestApiMapper(CarrierMapperBase):
         "cost": UniversalFieldNames.COST,
         "currency": UniversalFieldNames.CURRENCY,
     }
+)
 
-    STATUS_MAPPING = {
+_STATUS_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
         "DELIVERED": "delivered",
         "IN_TRANSIT": "in_transit",
         "OUT_FOR_DELIVERY": "out_for_delivery",
@@ -62,6 +62,109 @@ class RoyalMailRestApiMapper(CarrierMapperBase):
         "CANCELLED": "cancelled",
         "UNKNOWN": "unknown",
     }
+)
+
+
+class _StatusLookup(dict):
+    """Status table whose misses resolve by upper-case lookup, then lowercase."""
+
+    def __missing__(self, status: str) -> str:
+        return self.get(status.upper()) or status.lower()
+
+
+# Statuses keyed by the UPPER, lower and Title casings seen on the wire, so the
+# usual status is one lookup with no string allocation; other casings and
+# unknown statuses go through _StatusLookup.__missing__.
+_STATUS_LOOKUP: Mapping[str, str] = MappingProxyType(
+    _StatusLookup(
+        (variant, status)
+        for raw, status in _STATUS_MAPPING.items()
+        for variant in (raw, raw.lower(), raw.title())
+    )
+)
+
+# Universal fields whose values are parsed as dates
+_DATE_FIELDS = frozenset(
+    (
+        UniversalFieldNames.LAST_UPDATE,
+        UniversalFieldNames.ESTIMATED_DELIVERY,
+        UniversalFieldNames.CREATED_AT,
+        UniversalFieldNames.UPDATED_AT,
+        UniversalFieldNames.DELIVERED_AT,
+    )
+)
+
+# Zero-padded "YYYY-MM-DD[ HH:MM:SS]" (the usual non-T shape) is parsed by the
+# C-level fromisoformat; strptime is left for the looser shapes below.
+_ISO_LIKE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}(?: [0-9]{2}:[0-9]{2}:[0-9]{2})?")
+
+# Non-ISO date shapes, each matched by a precompiled regex so strptime runs
+# only against the format(s) that can fit (day-first before month-first).
+_DATE_PARSERS: Tuple[Tuple[Pattern[str], Tuple[str, ...]], ...] = (
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), ("%Y-%m-%d",)),
+    (
+        re.compile(r"\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{1,2}:\d{1,2}"),
+        ("%Y-%m-%d %H:%M:%S",),
+    ),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), ("%d/%m/%Y", "%m/%d/%Y")),
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """Parse a non-empty date string to ISO 8601; None if unparseable.
+
+    Event histories repeat the same timestamps, so results (including
+    failures) are cached on the raw string.
+    """
+    try:
+        # Try ISO format first (most common)
+        if "T" in date_str or date_str.endswith("Z"):
+            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        elif _ISO_LIKE.fullmatch(date_str):
+            dt = datetime.fromisoformat(date_str)
+        else:
+            # Pick the common date format by shape, then strptime once
+            for pattern, formats in _DATE_PARSERS:
+                if pattern.fullmatch(date_str):
+                    break
+            else:
+                return None
+            for fmt in formats:
+                try:
+                    dt = datetime.strptime(date_str, fmt)
+                    break
+                except ValueError:
+                    continue
+            else:
+                return None
+        return dt.isoformat()
+    except (ValueError, TypeError):
+        return None
+
+
+@register_carrier("royal_mail")
+@register_carrier("royalmail")
+class RoyalMailRestApiMapper(CarrierMapperBase):
+    """
+    Mapper class for Royal Mail Rest API responses to Universal Carrier Format.
+    """
+
+    __slots__ = ()
+
+    FIELD_MAPPING = _FIELD_MAPPING
+    STATUS_MAPPING = _STATUS_MAPPING
+
+    # Location parts joined (in this order) by _format_location
+    _LOCATION_KEYS = (
+        "addressLine1",
+        "addressLine2",
+        "city",
+        "state",
+        "postalCode",
+        "country",
+    )
+    _LOCATION_KEY_SET = frozenset(_LOCATION_KEYS)
 
     def map_tracking_response(self, carrier_response: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -75,27 +178,28 @@ class RoyalMailRestApiMapper(CarrierMapperBase):
         """
         universal_response: Dict[str, Any] = {}
 
-        # Map simple fields using FIELD_MAPPING
-        for carrier_field, universal_field in self.FIELD_MAPPING.items():
-            value = carrier_response.get(carrier_field)
-            if value is not None:
-                if universal_field in (
-                    UniversalFieldNames.LAST_UPDATE,
-                    UniversalFieldNames.ESTIMATED_DELIVERY,
-                    UniversalFieldNames.CREATED_AT,
-                    UniversalFieldNames.UPDATED_AT,
-                    UniversalFieldNames.DELIVERED_AT,
-                ):
+        # Map simple fields using FIELD_MAPPING; walk the (usually small)
+        # payload rather than the whole mapping table
+        # Field names compared per item are bound once, outside the loop
+        field_mapping = _FIELD_MAPPING
+        date_fields = _DATE_FIELDS
+        status_field = UniversalFieldNames.STATUS
+        events_field = UniversalFieldNames.EVENTS
+        proof_of_delivery_field = UniversalFieldNames.PROOF_OF_DELIVERY
+        for carrier_field, value in carrier_response.items():
+            universal_field = field_mapping.get(carrier_field)
+            if universal_field is not None and value is not None:
+                if universal_field in date_fields:
                     parsed_date = self._parse_date(value)
                     if parsed_date:
                         universal_response[universal_field] = parsed_date
-                elif universal_field == UniversalFieldNames.STATUS:
-                    universal_response[universal_field] = self.STATUS_MAPPING.get(
-                        str(value).upper(), str(value).lower()
-                    )
-                elif universal_field == UniversalFieldNames.EVENTS:
+                elif universal_field == status_field:
+                    universal_response[universal_field] = _STATUS_LOOKUP[
+                        value if isinstance(value, str) else str(value)
+                    ]
+                elif universal_field == events_field:
                     universal_response[universal_field] = self._map_events(value)
-                elif universal_field == UniversalFieldNames.PROOF_OF_DELIVERY:
+                elif universal_field == proof_of_delivery_field:
                     universal_response[universal_field] = self._map_proof_of_delivery(
                         value
                     )
@@ -124,44 +228,60 @@ class RoyalMailRestApiMapper(CarrierMapperBase):
         Returns:
             List[Dict[str, Any]]: List of mapped event dictionaries.
         """
-        if not isinstance(events, list):
+        # JSON arrays decode to exact lists; an identity check skips the MRO walk
+        if type(events) is not list or not events:
             return []
 
-        mapped_events = []
-        for event in events:
-            if not isinstance(event, dict):
-                continue
-            mapped_event = {}
-            # Map event type
-            event_type = event.get("eventType") or event.get("type")
-            if event_type:
-                mapped_event[UniversalFieldNames.EVENT_TYPE] = event_type
-
-            # Map event datetime
-            event_datetime_raw = event.get("eventDateTime") or event.get("dateTime")
-            event_datetime = self._parse_date(event_datetime_raw)
-            if event_datetime:
-                mapped_event[UniversalFieldNames.EVENT_DATETIME] = event_datetime
-
-            # Map event description
-            description = event.get("eventDescription") or event.get("description")
-            if description:
-                mapped_event[UniversalFieldNames.EVENT_DESCRIPTION] = description
-
-            # Map event location
-            location = event.get("eventLocation") or event.get("location")
-            if location:
-                if isinstance(location, dict):
-                    mapped_event[UniversalFieldNames.EVENT_LOCATION] = (
-                        self._format_location(location)
-                    )
-                elif isinstance(location, str):
-                    mapped_event[UniversalFieldNames.EVENT_LOCATION] = location
+        # JSON events are plain dicts: the exact-type check filters malformed
+        # entries, and events that map to nothing are dropped
+        map_event = self._map_event
+        return [
+            mapped_event
+            for event in events
+            if type(event) is dict and (mapped_event := map_event(event))
+        ]
 
-            if mapped_event:
-                mapped_events.append(mapped_event)
+    def _map_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Maps a single carrier event to universal format.
 
-        return mapped_events
+        Args:
+            event (Dict[str, Any]): One event from the carrier response.
+
+        Returns:
+            Dict[str, Any]: Mapped event (empty if nothing could be mapped).
+        """
+        # Aliases stay inline "get(a) or get(b)": two C-level lookups beat a
+        # looping resolver function; get is bound once for all of them
+        get = event.get
+        mapped_event = {}
+        # Map event type
+        event_type = get("eventType") or get("type")
+        if event_type:
+            mapped_event[UniversalFieldNames.EVENT_TYPE] = event_type
+
+        # Map event datetime
+        event_datetime_raw = get("eventDateTime") or get("dateTime")
+        event_datetime = self._parse_date(event_datetime_raw)
+        if event_datetime:
+            mapped_event[UniversalFieldNames.EVENT_DATETIME] = event_datetime
+
+        # Map event description
+        description = get("eventDescription") or get("description")
+        if description:
+            mapped_event[UniversalFieldNames.EVENT_DESCRIPTION] = description
+
+        # Map event location
+        location = get("eventLocation") or get("location")
+        if location:
+            if isinstance(location, dict):
+                mapped_event[UniversalFieldNames.EVENT_LOCATION] = (
+                    self._format_location(location)
+                )
+            elif isinstance(location, str):
+                mapped_event[UniversalFieldNames.EVENT_LOCATION] = location
+
+        return mapped_event
 
     def _map_proof_of_delivery(self, pod_data: Any) -> Dict[str, Any]:
         """
@@ -206,19 +326,16 @@ class RoyalMailRestApiMapper(CarrierMapperBase):
         if not location:
             return ""
 
-        parts = []
-        for key in (
-            "addressLine1",
-            "addressLine2",
-            "city",
-            "state",
-            "postalCode",
-            "country",
-        ):
-            val = location.get(key)
-            if val:
-                parts.append(str(val).strip())
-        return ", ".join(parts)
+        # One C-level intersection finds the address keys actually present;
+        # only those are looked up (locations are usually just city/country)
+        present = location.keys() & self._LOCATION_KEY_SET
+        if not present:
+            return ""
+        return ", ".join(
+            str(val).strip()
+            for key in self._LOCATION_KEYS
+            if key in present and (val := location[key])
+        )
 
     def _parse_date(self, date_str: Optional[str]) -> Optional[str]:
         """
@@ -232,23 +349,7 @@ class RoyalMailRestApiMapper(CarrierMapperBase):
         """
         if not date_str or not isinstance(date_str, str):
             return None
-        try:
-            # Try ISO format first (most common)
-            if "T" in date_str or date_str.endswith("Z"):
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            else:
-                # Try common date formats
-                for fmt in ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%d/%m/%Y", "%m/%d/%Y"]:
-                    try:
-                        dt = datetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    return None
-            return dt.isoformat()
-        except (ValueError, TypeError):
-            return None
+        return _parse_date_cached(date_str)
 
     def map_carrier_schema(
         self, carrier_schema: Dict[str, Any]
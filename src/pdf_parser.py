@@ -5,13 +5,79 @@ Extracts text content from PDF files, for parsing carrier API documentation.
 """
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pdfplumber
+import pymupdf
 
 logger = logging.getLogger(__name__)
 
+# Text extraction backends: PyMuPDF (MuPDF, C) is much faster per page than
+# pdfplumber (pure Python over pdfminer.six); pdfplumber stays selectable.
+PDF_BACKENDS = ("pymupdf", "pdfplumber")
+
+# Below this many pages, extracting in one process beats the cost of
+# starting worker processes (~100 ms each).
+DEFAULT_PARALLEL_MIN_PAGES = 8
+
+# Workers are started fresh (forkserver, or spawn where unavailable) rather
+# than forked: forking a multi-threaded host such as the API server can copy
+# locks held by other threads (logging handlers etc.) and deadlock a worker.
+_WORKER_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# (resolved path, mtime_ns, size): identifies one version of a file on disk
+_FileKey = Tuple[str, int, int]
+
+# PyMuPDF >= 1.26 prints a one-off layout-package hint to stdout on first
+# table search; keep library output quiet.
+if hasattr(pymupdf, "no_recommend_layout"):
+    pymupdf.no_recommend_layout()
+
+# One page's extracted text and tables (tables None when not extracted)
+_PageContent = Tuple[Optional[str], Optional[List[list]]]
+
+
+def _pdfplumber_page(page: Any, extract_tables: bool) -> _PageContent:
+    """Extract text (and optionally tables) from a pdfplumber page."""
+    return (
+        page.extract_text(),
+        page.extract_tables() if extract_tables else None,
+    )
+
+
+def _pymupdf_page(page: Any, extract_tables: bool) -> _PageContent:
+    """Extract text (and optionally tables) from a PyMuPDF page."""
+    tables = None
+    if extract_tables:
+        tables = [table.extract() for table in page.find_tables().tables]
+    return page.get_text("text").rstrip("\n"), tables
+
+
+def _extract_page_range(
+    backend: str, pdf_path: str, start: int, stop: int, extract_tables: bool
+) -> List[_PageContent]:
+    """
+    Extract pages [start, stop) of a PDF (worker process entry point).
+
+    Each worker opens the PDF itself: open documents cannot be shared
+    between processes.
+    """
+    if backend == "pdfplumber":
+        with pdfplumber.open(pdf_path) as pdf:
+            return [
+                _pdfplumber_page(pdf.pages[idx], extract_tables)
+                for idx in range(start, stop)
+            ]
+    with pymupdf.open(pdf_path) as doc:
+        return [_pymupdf_page(doc[idx], extract_tables) for idx in range(start, stop)]
+
 
 class PdfParserService:
     """
@@ -36,10 +102,33 @@ class PdfParserService:
             config: Optional configuration dictionary
                 - 'extract_tables': bool - Whether to extract table data (default: False)
                 - 'combine_pages': bool - Combine all pages into single text (default: True)
+                - 'backend': str - 'pymupdf' (default) or 'pdfplumber'
+                - 'parallel': bool - Extract large PDFs in worker processes
+                  (default: False)
+                - 'parallel_min_pages': int - Page count from which 'parallel'
+                  applies (default: 8)
+                - 'max_workers': int - Worker processes (default: os.cpu_count())
+
+        Raises:
+            ValueError: If backend is not one of PDF_BACKENDS
         """
         self.config = config or {}
         self.extract_tables = self.config.get("extract_tables", False)
         self.combine_pages = self.config.get("combine_pages", True)
+        self.backend = self.config.get("backend", "pymupdf")
+        self.parallel = self.config.get("parallel", False)
+        self.parallel_min_pages = self.config.get(
+            "parallel_min_pages", DEFAULT_PARALLEL_MIN_PAGES
+        )
+        self.max_workers = self.config.get("max_workers") or os.cpu_count() or 1
+        if self.backend not in PDF_BACKENDS:
+            raise ValueError(
+                f"Unknown PDF backend: {self.backend!r}. "
+                f"Expected one of: {', '.join(PDF_BACKENDS)}"
+            )
+        # Metadata read while extracting text, so a following extract_metadata
+        # on the same (unchanged) file does not open and parse it again.
+        self._last_metadata: Optional[Tuple[_FileKey, Dict[str, Any]]] = None
 
     def extract_text(self, pdf_path: str) -> str:
         """
@@ -62,14 +151,14 @@ class PdfParserService:
         logger.info(f"Starting PDF text extraction: {pdf_path}")
 
         try:
-            # Extract text using pdfplumber
-            text = self._extract_text_from_pdf(pdf_path)
+            # Extract text using the configured backend (one open of the PDF)
+            text, page_count = self._extract_text_from_pdf(pdf_path)
 
             logger.info(
                 f"Successfully extracted text from PDF: {pdf_path}",
                 extra={
                     "text_length": len(text),
-                    "pages": self._get_page_count(pdf_path),
+                    "pages": page_count,
                 },
             )
 
@@ -99,24 +188,24 @@ class PdfParserService:
         self._validate_pdf_path(pdf_path)
 
         try:
-            path = Path(pdf_path)
-            file_size = path.stat().st_size if path.exists() else 0
-
-            with pdfplumber.open(pdf_path) as pdf:
-                metadata = {
-                    "page_count": len(pdf.pages),
-                    "file_size": file_size,
-                    "title": pdf.metadata.get("Title", ""),
-                    "author": pdf.metadata.get("Author", ""),
-                    "created": pdf.metadata.get("CreationDate", ""),
-                }
-
-                logger.debug(
-                    f"Extracted metadata from PDF: {pdf_path} - "
-                    f"Pages: {metadata.get('page_count')}, "
-                    f"Size: {metadata.get('file_size')} bytes"
-                )
-                return metadata
+            file_key = self._file_key(pdf_path)
+            if self._last_metadata is not None and self._last_metadata[0] == file_key:
+                # Already read by extract_text on this version of the file
+                return dict(self._last_metadata[1])
+
+            if self.backend == "pdfplumber":
+                with pdfplumber.open(pdf_path) as pdf:
+                    metadata = self._pdfplumber_metadata(pdf, file_key[2])
+            else:
+                with pymupdf.open(pdf_path) as doc:
+                    metadata = self._pymupdf_metadata(doc, file_key[2])
+
+            logger.debug(
+                f"Extracted metadata from PDF: {pdf_path} - "
+                f"Pages: {metadata.get('page_count')}, "
+                f"Size: {metadata.get('file_size')} bytes"
+            )
+            return metadata
 
         except (OSError, ValueError) as e:
             logger.error(
@@ -156,44 +245,74 @@ class PdfParserService:
         if not path.stat().st_mode & 0o444:  # Check read permission
             raise PermissionError(f"Cannot read PDF file: {pdf_path}")
 
-    def _extract_text_from_pdf(self, pdf_path: str) -> str:
+    def _file_key(self, pdf_path: str) -> _FileKey:
+        """
+        Identify the current version of a file (path, mtime, size).
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Key that changes whenever the file is replaced or modified
+        """
+        path = Path(pdf_path)
+        stat = path.stat()
+        return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def _pdfplumber_metadata(self, pdf: Any, file_size: int) -> Dict[str, Any]:
+        """Build the metadata dict from an open pdfplumber PDF."""
+        return {
+            "page_count": len(pdf.pages),
+            "file_size": file_size,
+            "title": pdf.metadata.get("Title", ""),
+            "author": pdf.metadata.get("Author", ""),
+            "created": pdf.metadata.get("CreationDate", ""),
+        }
+
+    def _pymupdf_metadata(self, doc: Any, file_size: int) -> Dict[str, Any]:
+        """Build the metadata dict from an open PyMuPDF document."""
+        pdf_metadata = doc.metadata or {}
+        return {
+            "page_count": doc.page_count,
+            "file_size": file_size,
+            "title": pdf_metadata.get("title") or "",
+            "author": pdf_metadata.get("author") or "",
+            "created": pdf_metadata.get("creationDate") or "",
+        }
+
+    def _extract_text_from_pdf(self, pdf_path: str) -> Tuple[str, int]:
         """
-        Internal method to extract text from PDF using pdfplumber.
+        Internal method to extract text from PDF using the configured backend.
+
+        The PDF is opened once: page count and metadata are read from the same
+        open document (metadata is kept for a following extract_metadata).
 
         Args:
             pdf_path: Path to PDF file
 
         Returns:
-            Extracted text content
+            Tuple of (extracted text content, page count)
         """
-        text_parts = []
+        text_parts: List[str] = []
 
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    # Extract text from page
-                    page_text = page.extract_text()
-
-                    if page_text:
-                        if self.combine_pages:
-                            text_parts.append(page_text)
-                        else:
-                            # Add page separator if not combining
-                            text_parts.append(f"\n--- Page {page_num} ---\n{page_text}")
-
-                    # Extract tables if configured (like extracting structured data)
-                    if self.extract_tables:
-                        tables = page.extract_tables()
-                        if tables:
-                            for table_idx, table in enumerate(tables, start=1):
-                                # Convert table to Markdown format
-                                table_text = self._table_to_text(table)
-                                # Mark table clearly for LLM processing
-                                text_parts.append(
-                                    f"\n<!-- TABLE START: Page {page_num}, Table {table_idx} -->\n"
-                                    f"{table_text}\n"
-                                    f"<!-- TABLE END -->\n"
-                                )
+            file_key = self._file_key(pdf_path)
+            if self.backend == "pdfplumber":
+                with pdfplumber.open(pdf_path) as pdf:
+                    metadata = self._pdfplumber_metadata(pdf, file_key[2])
+                    pages = self._extract_pages(
+                        pdf_path, pdf.pages, metadata["page_count"], _pdfplumber_page
+                    )
+                    for page_num, (page_text, tables) in enumerate(pages, start=1):
+                        self._add_page_text(text_parts, page_num, page_text, tables)
+            else:
+                with pymupdf.open(pdf_path) as doc:
+                    metadata = self._pymupdf_metadata(doc, file_key[2])
+                    pages = self._extract_pages(
+                        pdf_path, doc, metadata["page_count"], _pymupdf_page
+                    )
+                    for page_num, (page_text, tables) in enumerate(pages, start=1):
+                        self._add_page_text(text_parts, page_num, page_text, tables)
 
             # Combine all text parts
             combined_text = "\n".join(text_parts)
@@ -204,7 +323,8 @@ class PdfParserService:
                     f"PDF appears to be empty or contains only images: {pdf_path}"
                 )
 
-            return combined_text
+            self._last_metadata = (file_key, metadata)
+            return combined_text, metadata["page_count"]
 
         except (OSError, ValueError) as e:
             raise ValueError(f"Failed to extract text from PDF: {e}") from e
@@ -220,6 +340,93 @@ class PdfParserService:
             logger.error(f"Error extracting text from PDF: {pdf_path}", exc_info=True)
             raise ValueError(f"Failed to extract text from PDF: {e}") from e
 
+    def _extract_pages(
+        self, pdf_path: str, pages: Any, page_count: int, extract_page: Any
+    ) -> Iterable[_PageContent]:
+        """
+        Extract every page in order, in worker processes for large PDFs.
+
+        Pages parse independently and are CPU-bound (pdfminer and PyMuPDF
+        table detection hold the GIL). With 'parallel' enabled, PDFs with at
+        least parallel_min_pages pages are split into contiguous page ranges,
+        one per worker process. Otherwise, or if the worker pool cannot be
+        started or breaks, pages are extracted from the open document.
+
+        Args:
+            pdf_path: Path to PDF file (reopened by each worker)
+            pages: Pages of the already open document
+            page_count: Number of pages
+            extract_page: Backend page extractor (_pdfplumber_page/_pymupdf_page)
+
+        Returns:
+            (text, tables) per page, in page order
+        """
+        workers = min(self.max_workers, page_count)
+        if not self.parallel or workers < 2 or page_count < self.parallel_min_pages:
+            return (extract_page(page, self.extract_tables) for page in pages)
+
+        chunk_size = -(-page_count // workers)  # ceil division
+        starts = range(0, page_count, chunk_size)
+        logger.debug(
+            f"Extracting {page_count} pages with {len(starts)} worker processes"
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=len(starts),
+                mp_context=multiprocessing.get_context(_WORKER_START_METHOD),
+            ) as executor:
+                chunks = executor.map(
+                    _extract_page_range,
+                    [self.backend] * len(starts),
+                    [pdf_path] * len(starts),
+                    starts,
+                    [min(start + chunk_size, page_count) for start in starts],
+                    [self.extract_tables] * len(starts),
+                )
+                # executor.map yields in submission order, so pages stay in order
+                return [page for chunk in chunks for page in chunk]
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(
+                f"Parallel PDF extraction failed ({e}); extracting in-process: "
+                f"{pdf_path}"
+            )
+            return (extract_page(page, self.extract_tables) for page in pages)
+
+    def _add_page_text(
+        self,
+        text_parts: List[str],
+        page_num: int,
+        page_text: Optional[str],
+        tables: Optional[List[list]],
+    ) -> None:
+        """
+        Append one page's text (and tables, if extracted) to text_parts.
+
+        Args:
+            text_parts: Accumulated text parts for the document
+            page_num: 1-based page number
+            page_text: Text extracted from the page (None/empty if none)
+            tables: Tables extracted from the page as lists of rows, or None
+        """
+        if page_text:
+            if self.combine_pages:
+                text_parts.append(page_text)
+            else:
+                # Add page separator if not combining
+                text_parts.append(f"\n--- Page {page_num} ---\n{page_text}")
+
+        # Extract tables if configured (like extracting structured data)
+        if tables:
+            for table_idx, table in enumerate(tables, start=1):
+                # Convert table to Markdown format
+                table_text = self._table_to_text(table)
+                # Mark table clearly for LLM processing
+                text_parts.append(
+                    f"\n<!-- TABLE START: Page {page_num}, Table {table_idx} -->\n"
+                    f"{table_text}\n"
+                    f"<!-- TABLE END -->\n"
+                )
+
     def _table_to_text(self, table: list) -> str:
         """
         Convert table data to Markdown table format for better LLM parsing.
@@ -261,21 +468,3 @@ class PdfParserService:
             lines.append("| " + " | ".join(row_text) + " |")
 
         return "\n".join(lines)
-
-    def _get_page_count(self, pdf_path: str) -> int:
-        """
-        Get number of pages in PDF.
-
-        Args:
-            pdf_path: Path to PDF file
-
-        Returns:
-            Number of pages
-        """
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                return len(pdf.pages)
-        except OSError:
-            return 0
-        except Exception:
-            return 0
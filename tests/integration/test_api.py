@@ -97,6 +97,34 @@ class TestAPIEndpoints:
         assert data["current_location"]["city"] == "London"
         assert "estimated_delivery" in data
 
+    def test_convert_cache_reuses_result_for_identical_payload(self, client):
+        """POST /convert with CONVERT_CACHE_SIZE set maps a repeated payload once."""
+        from src import api
+        from src.mappers.example_mapper import ExampleMapper
+
+        body = {"carrier_response": {"trk_num": "1234567890", "stat": "DELIVERED"}}
+        api._convert_cache.clear()
+        try:
+            with (
+                patch("src.api._convert_cache_size", return_value=1),
+                patch.object(
+                    ExampleMapper,
+                    "map_tracking_response",
+                    autospec=True,
+                    side_effect=ExampleMapper.map_tracking_response,
+                ) as mapped,
+            ):
+                first = client.post("/convert", json=body)
+                second = client.post("/convert", json=body)
+                client.post("/convert", json={"carrier_response": {"trk_num": "2"}})
+                third = client.post("/convert", json=body)
+        finally:
+            api._convert_cache.clear()
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json() == third.json()
+        # Cache of one: the different payload evicts the first result
+        assert mapped.call_count == 3
+
     def test_convert_validation_error(self, client):
         """POST /convert with missing carrier_response returns 422 and error envelope."""
         response = client.post("/convert", json={})
@@ -140,6 +168,43 @@ class TestAPIEndpoints:
         )
         _assert_error_envelope(response, "not_found", 404)
 
+    def test_convert_batch_maps_each_response_in_order(self, client):
+        """POST /convert/batch returns one universal JSON per carrier response."""
+        response = client.post(
+            "/convert/batch",
+            json={
+                "carrier_responses": [
+                    {"trk_num": "1", "stat": "IN_TRANSIT"},
+                    {},
+                    {"trk_num": "2", "stat": "DELIVERED"},
+                ],
+            },
+        )
+        assert response.status_code == 200
+        assert response.json() == [
+            {"tracking_number": "1", "status": "in_transit"},
+            {},
+            {"tracking_number": "2", "status": "delivered"},
+        ]
+
+    def test_convert_batch_unknown_carrier_returns_404(self, client):
+        """POST /convert/batch with unknown carrier slug returns 404 and error envelope."""
+        response = client.post(
+            "/convert/batch",
+            json={"carrier_responses": [], "carrier": "nonexistent_carrier_slug"},
+        )
+        _assert_error_envelope(response, "not_found", 404)
+
+    def test_convert_batch_too_many_items_returns_422(self, client):
+        """POST /convert/batch over the item limit returns 422."""
+        from src.api import MAX_CONVERT_BATCH_ITEMS
+
+        response = client.post(
+            "/convert/batch",
+            json={"carrier_responses": [{}] * (MAX_CONVERT_BATCH_ITEMS + 1)},
+        )
+        _assert_error_envelope(response, "validation_error", 422)
+
     def test_convert_bad_nested_structure_no_500(self, client):
         """POST /convert with valid dict but weird nested types returns 4xx with envelope, not 500."""
         # Example mapper may still succeed with extra keys; use a payload that can trigger mapper errors
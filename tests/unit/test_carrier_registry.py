@@ -0,0 +1,98 @@
+"""
+Tests for CarrierRegistry.
+
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.mappers import CarrierRegistry
+from src.mappers.base import CarrierMapperBase
+from src.mappers.dhl_express_mapper import MydhlMapper
+from src.mappers.example_mapper import ExampleMapper
+
+
+class _RegistryTestMapper(CarrierMapperBase):
+    """Minimal mapper used to exercise registration."""
+
+    def map_tracking_response(self, carrier_response):
+        return {}
+
+
+@pytest.fixture
+def registry_slug():
+    """Register a throwaway mapper and remove it afterwards."""
+    slug = "registry_test_carrier"
+    CarrierRegistry.register(slug, _RegistryTestMapper)
+    yield slug
+    CarrierRegistry._mappers.pop(slug, None)
+    CarrierRegistry._instances.pop(slug, None)
+
+
+@pytest.mark.unit
+class TestCarrierRegistry:
+    """Test CarrierRegistry lookups."""
+
+    def test_get_class_normalizes_slug(self):
+        """Test slug lookup ignores case and surrounding whitespace."""
+        assert CarrierRegistry.get_class("  Example ") is ExampleMapper
+
+    def test_is_registered_normalizes_slug(self):
+        """Test exact and un-normalized slugs are both recognised."""
+        assert CarrierRegistry.is_registered("example")
+        assert CarrierRegistry.is_registered(" EXAMPLE ")
+        assert not CarrierRegistry.is_registered("no_such_carrier")
+
+    def test_mydhl_slug_resolves_to_single_mapper(self):
+        """Test "mydhl" is bound to the one MydhlMapper implementation."""
+        mapper_class = CarrierRegistry.get_class("mydhl")
+        assert mapper_class is MydhlMapper
+        assert mapper_class.__module__ == "src.mappers.dhl_express_mapper"
+        assert mapper_class.__qualname__ == "MydhlMapper"
+
+    def test_get_unknown_slug_raises_key_error(self):
+        """Test unknown slug lists registered carriers."""
+        with pytest.raises(KeyError, match="Registered: .*example"):
+            CarrierRegistry.get("no_such_carrier")
+
+    def test_get_instance_is_shared(self):
+        """Test get_instance reuses one mapper instance per slug."""
+        first = CarrierRegistry.get_instance("example")
+        assert isinstance(first, ExampleMapper)
+        assert CarrierRegistry.get_instance("EXAMPLE") is first
+
+    def test_register_replaces_cached_instance(self, registry_slug):
+        """Test re-registering a slug drops the cached instance."""
+        first = CarrierRegistry.get_instance(registry_slug)
+        CarrierRegistry.register(registry_slug, _RegistryTestMapper)
+        assert CarrierRegistry.get_instance(registry_slug) is not first
+
+    def test_register_rejects_non_mapper(self):
+        """Test register only accepts CarrierMapperBase subclasses."""
+        with pytest.raises(TypeError):
+            CarrierRegistry.register("bad", dict)  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+def test_example_mappers_can_be_excluded_at_import():
+    """Test UCF_INCLUDE_EXAMPLES=0 defers example mapper imports until accessed."""
+    code = (
+        "import sys\n"
+        "import src.mappers as mappers\n"
+        "before = mappers.CarrierRegistry.is_registered('example')\n"
+        "mappers.ExampleMapper\n"
+        "print(before, mappers.CarrierRegistry.is_registered('example'))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[2],
+        env={**os.environ, "UCF_INCLUDE_EXAMPLES": "0"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["False", "True"]
@@ -0,0 +1,381 @@
+"""
+Tests for MYDHL (DHL Express) Mapper.
+
+"""
+
+import pytest
+
+from src.mappers.dhl_express_mapper import MydhlMapper
+
+
+def _response(**awb_info):
+    """Wrap a single AWBInfo item in the MYDHL tracking envelope."""
+    return {"TrackingResponse": {"AWBInfo": {"ArrayOfAWBInfoItem": [awb_info]}}}
+
+
+def _event(date, time, offset=None, code=None, description=None, area=None):
+    """Build a MYDHL piece event."""
+    event = {"Date": date, "Time": time}
+    if offset is not None:
+        event["GMTOffset"] = offset
+    if code or description:
+        event["ServiceEvent"] = {"EventCode": code, "Description": description}
+    if area:
+        event["ServiceArea"] = area
+    return event
+
+
+def _pieces(*piece_events):
+    """Wrap per-piece event lists in the MYDHL Pieces envelope."""
+    return {
+        "PieceInfo": {
+            "ArrayOfPieceInfoItem": [
+                {"PieceEvent": {"ArrayOfPieceEventItem": list(events)}}
+                for events in piece_events
+            ]
+        }
+    }
+
+
+@pytest.mark.unit
+class TestMydhlMapper:
+    """Test MydhlMapper."""
+
+    @pytest.fixture
+    def mapper(self):
+        """Create mapper instance."""
+        return MydhlMapper()
+
+    def test_mapping_tables_are_read_only(self, mapper):
+        """FIELD_MAPPING / STATUS_MAPPING are shared, read-only tables."""
+        with pytest.raises(TypeError):
+            mapper.STATUS_MAPPING["Success"] = "other"
+        with pytest.raises(TypeError):
+            mapper.FIELD_MAPPING["AWBNumber"] = "other"
+        assert mapper.STATUS_MAPPING is MydhlMapper().STATUS_MAPPING
+
+    def test_mapper_has_no_instance_dict(self, mapper):
+        """Test the stateless mapper uses __slots__ (no per-instance __dict__)."""
+        assert not hasattr(mapper, "__dict__")
+
+    def test_map_tracking_response_basic(self, mapper):
+        """Test tracking number and status mapping."""
+        result = mapper.map_tracking_response(
+            _response(AWBNumber="1234567890", Status={"ActionStatus": "Delivered"})
+        )
+        assert result["tracking_number"] == "1234567890"
+        assert result["status"] == "delivered"
+
+    @pytest.mark.parametrize("raw", ["In Transit", "in transit", "IN TRANSIT"])
+    def test_status_lookup_is_case_insensitive(self, mapper, raw):
+        """Test status casing drift still maps to the universal status."""
+        result = mapper.map_tracking_response(_response(Status={"ActionStatus": raw}))
+        assert result["status"] == "in_transit"
+
+    def test_unknown_status_is_lowercased(self, mapper):
+        """Test unknown status falls back to lowercase."""
+        result = mapper.map_tracking_response(
+            _response(Status={"ActionStatus": "Held At Customs"})
+        )
+        assert result["status"] == "held at customs"
+
+    def test_map_tracking_response_empty(self, mapper):
+        """Test mapping empty response."""
+        assert mapper.map_tracking_response({}) == {}
+
+    def test_events_latest_update_and_location(self, mapper):
+        """Test events are sorted and the latest one drives last_update/location."""
+        result = mapper.map_tracking_response(
+            _response(
+                AWBNumber="1234567890",
+                Pieces=_pieces(
+                    [
+                        _event(
+                            "2026-01-24",
+                            "10:00:00",
+                            "+01:00",
+                            code="PU",
+                            description="Picked up",
+                            area={"ServiceAreaCode": "FRA"},
+                        ),
+                        _event(
+                            "2026-01-25",
+                            "14:30:00",
+                            "+01:00",
+                            code="AR",
+                            description="Arrived",
+                            area={"Description": "London", "ServiceAreaCode": "LHR"},
+                        ),
+                    ]
+                ),
+            )
+        )
+        assert result["last_update"] == "2026-01-25T14:30:00+01:00"
+        assert result["current_location"] == "London"
+        assert [e["event_type"] for e in result["events"]] == ["PU", "AR"]
+        assert result["events"][0] == {
+            "event_datetime": "2026-01-24T10:00:00+01:00",
+            "event_type": "PU",
+            "event_description": "Picked up",
+            "event_location": "FRA",
+        }
+
+    def test_events_sorted_chronologically_across_offsets(self, mapper):
+        """Test events are ordered by instant, not by their ISO string."""
+        result = mapper.map_tracking_response(
+            _response(
+                Pieces=_pieces(
+                    [_event("2026-01-25", "14:00:00", "+00:00", code="LATE")],
+                    [_event("2026-01-25", "14:30:00", "+02:00", code="EARLY")],
+                    [_event(None, None, code="UNDATED")],
+                )
+            )
+        )
+        assert [e["event_type"] for e in result["events"]] == [
+            "UNDATED",
+            "EARLY",
+            "LATE",
+        ]
+
+    def test_events_merged_across_unordered_pieces(self, mapper):
+        """Test piece timelines merge in order even when a piece is unsorted."""
+        result = mapper.map_tracking_response(
+            _response(
+                Pieces=_pieces(
+                    [
+                        _event("2026-01-25", "12:00:00", code="P1-C"),
+                        _event("2026-01-25", "08:00:00", code="P1-A"),
+                    ],
+                    [
+                        _event("2026-01-25", "10:00:00", code="P2-B"),
+                        _event("2026-01-25", "12:00:00", code="P2-C"),
+                    ],
+                )
+            )
+        )
+        assert [e["event_type"] for e in result["events"]] == [
+            "P1-A",
+            "P2-B",
+            "P1-C",
+            "P2-C",
+        ]
+
+    def test_columnar_events_match_row_events(self, mapper):
+        """Test the columnar mapping transposes the same ordered events."""
+        response = _response(
+            AWBNumber="1234567890",
+            Pieces=_pieces(
+                [
+                    _event(
+                        "2026-01-25",
+                        "12:00:00",
+                        code="AR",
+                        area={"ServiceAreaCode": "LHR"},
+                    ),
+                    _event(
+                        "2026-01-25", "08:00:00", code="PU", description="Picked up"
+                    ),
+                ]
+            ),
+        )
+        rows = mapper.map_tracking_response(response)
+        columnar = mapper.map_tracking_response_columnar(response)
+
+        assert columnar["events"] == {
+            "event_datetime": ["2026-01-25T08:00:00", "2026-01-25T12:00:00"],
+            "event_type": ["PU", "AR"],
+            "event_description": ["Picked up", None],
+            "event_location": [None, "LHR"],
+        }
+        assert {k: v for k, v in columnar.items() if k != "events"} == {
+            k: v for k, v in rows.items() if k != "events"
+        }
+
+    def test_columnar_without_events(self, mapper):
+        """Test the columnar mapping omits events when there are none."""
+        result = mapper.map_tracking_response_columnar(_response(AWBNumber="1"))
+        assert result == {"tracking_number": "1"}
+
+    def test_map_tracking_responses_batch(self, mapper):
+        """Test batch mapping matches mapping each response in order."""
+        batch = [
+            _response(AWBNumber="1", Status={"ActionStatus": "Delivered"}),
+            {},
+            _response(
+                AWBNumber="2",
+                Pieces=_pieces([_event("2026-01-25", "14:30:00", code="AR")]),
+            ),
+        ]
+        assert mapper.map_tracking_responses(batch) == [
+            mapper.map_tracking_response(response) for response in batch
+        ]
+        assert mapper.map_tracking_responses(iter([])) == []
+
+    def test_estimated_delivery_and_countries(self, mapper):
+        """Test ShipmentInfo fields and last_update fallback."""
+        result = mapper.map_tracking_response(
+            _response(
+                ShipmentInfo={
+                    "EstimatedDeliveryDate": "20260130",
+                    "OriginServiceArea": {"ServiceAreaCode": "DE"},
+                    "DestinationServiceArea": {"ServiceAreaCode": "GB"},
+                }
+            )
+        )
+        assert result["estimated_delivery"] == "2026-01-30T00:00:00"
+        assert result["last_update"] == "2026-01-30T00:00:00"
+        assert result["origin_country"] == "DE"
+        assert result["destination_country"] == "GB"
+
+    def test_malformed_nested_values_are_skipped(self, mapper):
+        """Test malformed nested values are skipped without dropping good data."""
+        result = mapper.map_tracking_response(
+            _response(
+                AWBNumber="1234567890",
+                Status={"ActionStatus": 42},
+                Pieces=_pieces(
+                    [
+                        "not-an-event",
+                        {"Date": 20260125, "ServiceEvent": "bad"},
+                        _event("2026-01-25", "14:30:00", code="AR", area="bad"),
+                    ]
+                ),
+                ShipmentInfo={"DestinationServiceArea": {"ServiceAreaCode": "GB"}},
+            )
+        )
+        assert result["tracking_number"] == "1234567890"
+        assert "status" not in result
+        assert [e["event_type"] for e in result["events"]] == ["AR"]
+        assert result["destination_country"] == "GB"
+
+    def test_mixed_naive_and_aware_event_datetimes(self, mapper):
+        """Test events with and without GMT offsets can be compared."""
+        result = mapper.map_tracking_response(
+            _response(
+                Pieces=_pieces(
+                    [
+                        _event("2026-01-25", "10:00:00", code="A"),
+                        _event("2026-01-25", "12:00:00", "+00:00", code="B"),
+                    ]
+                )
+            )
+        )
+        assert result["last_update"] == "2026-01-25T12:00:00+00:00"
+        assert [e["event_type"] for e in result["events"]] == ["A", "B"]
+
+    def test_parse_event_datetime_offset_without_sign(self, mapper):
+        """Test GMT offsets without a sign are treated as positive."""
+        dt = mapper._parse_event_datetime(
+            {"Date": "2026-01-25", "Time": "14:30:00", "GMTOffset": "0100"}
+        )
+        assert dt.isoformat() == "2026-01-25T14:30:00+01:00"
+
+    @pytest.mark.parametrize(
+        "offset, expected",
+        [
+            ("+0100", "+01:00"),
+            ("-05:00", "-05:00"),
+            (" 05:30 ", "+05:30"),
+            ("-00:00", "+00:00"),
+            ("+01:00:00", "+01:00"),
+            ("+01:00:30", "+01:00:30"),
+            ("-010030", "-01:00:30"),
+        ],
+    )
+    def test_parse_event_datetime_offset_formats(self, mapper, offset, expected):
+        """Test the accepted GMT offset spellings normalize to +HH:MM."""
+        event = {"Date": "2026-01-25", "Time": "14:30:00", "GMTOffset": offset}
+        dt = mapper._parse_event_datetime(event)
+        assert dt.isoformat() == f"2026-01-25T14:30:00{expected}"
+        # The mapped string uses the same suffix as isoformat()
+        result = mapper.map_tracking_response(
+            _response(Pieces=_pieces([dict(event, ServiceEvent={"EventCode": "AR"})]))
+        )
+        assert result["last_update"] == dt.isoformat()
+
+    @pytest.mark.parametrize(
+        "offset",
+        ["GMT+1", "+24:00", "+0160", "+01:60", "+0100:30", "+01:00:00.5"],
+    )
+    def test_parse_event_datetime_bad_offset(self, mapper, offset):
+        """Test an unrecognised or out-of-range GMT offset is unparseable."""
+        assert (
+            mapper._parse_event_datetime(
+                {"Date": "2026-01-25", "Time": "14:30:00", "GMTOffset": offset}
+            )
+            is None
+        )
+
+    @pytest.mark.parametrize(
+        "date, time, offset, expected",
+        [
+            ("2026-01-25", "14:30:00", None, "2026-01-25T14:30:00"),
+            ("2026-01-25", None, None, "2026-01-25T00:00:00"),
+            ("2026-1-5", "09:30:00", None, "2026-01-05T09:30:00"),
+            ("2026-01-05", "9:30:00", "+0100", "2026-01-05T09:30:00+01:00"),
+            ("2026-01-25", "14:30", None, None),
+            ("2026-W04-7", "14:30:00", None, None),
+            ("20260125", "14:30:00", None, None),
+        ],
+    )
+    def test_parse_event_datetime_shapes(self, mapper, date, time, offset, expected):
+        """Test canonical and unpadded event dates parse; other shapes do not."""
+        dt = mapper._parse_event_datetime(_event(date, time, offset))
+        assert (dt.isoformat() if dt else None) == expected
+
+    def test_unpadded_event_date_keeps_datetime(self, mapper):
+        """Test an unpadded event Date still drives event_datetime/last_update."""
+        result = mapper.map_tracking_response(
+            _response(Pieces=_pieces([_event("2024-1-5", "09:30:00", code="PU")]))
+        )
+        assert result["last_update"] == "2024-01-05T09:30:00"
+        assert result["events"][0]["event_datetime"] == "2024-01-05T09:30:00"
+
+    def test_parse_event_datetime_is_shared_across_instances(self, mapper):
+        """Test repeated Date/Time/GMTOffset triples reuse one cached parse."""
+        event = {"Date": "2026-01-25", "Time": "14:30:00", "GMTOffset": "+01:00"}
+        assert mapper._parse_event_datetime(
+            event
+        ) is MydhlMapper()._parse_event_datetime(dict(event))
+
+    def test_parse_event_datetime_invalid(self, mapper):
+        """Test invalid event dates return None."""
+        assert mapper._parse_event_datetime({"Date": "invalid"}) is None
+        assert mapper._parse_event_datetime({}) is None
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("20260130", "2026-01-30T00:00:00"),
+            ("2026-01-30", "2026-01-30T00:00:00"),
+            ("2026-1-5", "2026-01-05T00:00:00"),
+            ("2026-01-30T18:00:00", "2026-01-30T18:00:00"),
+            ("2026-1-5T9:30:00", "2026-01-05T09:30:00"),
+            ("2026-01-30T18:00:00Z", "2026-01-30T18:00:00+00:00"),
+            ("2026-01-30T18:00:00+0100", "2026-01-30T18:00:00+01:00"),
+            ("2026-01-30T18:00:00-05:00", "2026-01-30T18:00:00-05:00"),
+        ],
+    )
+    def test_parse_date_formats(self, mapper, value, expected):
+        """Test each supported date shape parses to ISO 8601."""
+        assert mapper._parse_date(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "20261301",
+            "2026-02-30",
+            "2026-01-30T18:00:00 UTC",
+            "2026/01/30",
+            "2026-W05-1",
+            "2026-01-30T18:00",
+        ],
+    )
+    def test_parse_date_rejects_malformed(self, mapper, value):
+        """Test out-of-range or unsupported shapes return None."""
+        assert mapper._parse_date(value) is None
+
+    def test_parse_date_invalid(self, mapper):
+        """Test invalid date returns None."""
+        assert mapper._parse_date("not-a-date") is None
+        assert mapper._parse_date(None) is None
@@ -29,6 +29,11 @@ class TestMydhlApiMapper:
         assert isinstance(mapper.STATUS_MAPPING, dict)
         assert len(mapper.STATUS_MAPPING) > 0
 
+    def test_mapper_has_no_instance_dict(self, mapper):
+        """Test the stateless mapper uses __slots__ and shares its tables."""
+        assert not hasattr(mapper, "__dict__")
+        assert mapper.STATUS_MAPPING is MydhlApiMapper().STATUS_MAPPING
+
     def test_field_mapping_no_duplicates(self, mapper):
         """Test FIELD_MAPPING has no duplicate keys."""
         keys = list(mapper.FIELD_MAPPING.keys())
@@ -100,6 +105,28 @@ class TestMydhlApiMapper:
         assert len(result["events"]) == 1
         assert result["events"][0]["event_description"] == "In transit"
 
+    def test_map_tracking_responses_batch(self, mapper):
+        """Test batch mapping returns one universal dict per response, in order."""
+        batch = [
+            {
+                "TrackingResponse": {
+                    "AWBInfo": {
+                        "ArrayOfAWBInfoItem": [
+                            {"AWBNumber": "1", "Status": {"ActionStatus": "DELIVERED"}}
+                        ]
+                    }
+                }
+            },
+            {},
+        ]
+
+        result = mapper.map_tracking_responses(batch)
+
+        assert result == [
+            {"tracking_number": "1", "status": "delivered"},
+            {},
+        ]
+
     def test_map_tracking_response_empty(self, mapper):
         """Test mapping empty response."""
         result = mapper.map_tracking_response({})
@@ -112,6 +139,19 @@ class TestMydhlApiMapper:
         result = mapper.map_tracking_response(carrier_response)
         assert isinstance(result, dict)
 
+    @pytest.mark.parametrize(
+        "carrier_response",
+        [
+            {"TrackingResponse": None},
+            {"TrackingResponse": {"AWBInfo": "bad"}},
+            {"TrackingResponse": {"AWBInfo": {"ArrayOfAWBInfoItem": None}}},
+            {"TrackingResponse": {"AWBInfo": {"ArrayOfAWBInfoItem": ["bad"]}}},
+        ],
+    )
+    def test_map_tracking_response_malformed_envelope(self, mapper, carrier_response):
+        """Test a malformed AWBInfo envelope maps to an empty response."""
+        assert mapper.map_tracking_response(carrier_response) == {}
+
     def test_status_mapping(self, mapper):
         """Test status mapping converts correctly."""
         assert mapper.STATUS_MAPPING["DELIVERED"] == "delivered"
@@ -119,6 +159,22 @@ class TestMydhlApiMapper:
         assert mapper.STATUS_MAPPING["EXCEPTION"] == "exception"
         assert mapper.STATUS_MAPPING["PENDING"] == "pending"
 
+    @pytest.mark.parametrize(
+        "raw", ["IN_TRANSIT", "in_transit", "In_Transit", "iN_tRANSIT"]
+    )
+    def test_status_mapping_any_casing(self, mapper, raw):
+        """Test every casing of a known status maps to the universal status."""
+        result = mapper.map_tracking_response(
+            {
+                "TrackingResponse": {
+                    "AWBInfo": {
+                        "ArrayOfAWBInfoItem": [{"Status": {"ActionStatus": raw}}]
+                    }
+                }
+            }
+        )
+        assert result["status"] == "in_transit"
+
     def test_status_mapping_unknown_status(self, mapper):
         """Test unknown status is lowercased."""
         carrier_response = {
@@ -147,6 +203,25 @@ class TestMydhlApiMapper:
         result = mapper._parse_event_datetime("2026-01-25", None, None)
         assert result == "2026-01-25T00:00:00"
 
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            (("2026-01-25", "14:30", "+0100"), "2026-01-25T14:30:00+01:00"),
+            (("2026-01-25", "9:3:0", None), "2026-01-25T09:03:00"),
+            (("2026-1-5", "14:30:00", None), "2026-01-05T14:30:00"),
+            (("2026-02-30", "14:30:00", None), None),
+            (("2026-01-25", "25:00:00", None), None),
+            (("24-01-05", "10:00", "+0100"), None),
+            (("02026-01-25", "14:30:00", None), None),
+            (("2026-001-25", "14:30:00", None), None),
+            (("2026-1-5", "014:30:00", None), None),
+            (("2026-01- 5", "14:30:00", None), "2026-01-05T14:30:00"),
+        ],
+    )
+    def test_parse_event_datetime_shapes(self, mapper, args, expected):
+        """Test canonical, non-canonical and out-of-range event datetimes."""
+        assert mapper._parse_event_datetime(*args) == expected
+
     def test_parse_event_datetime_invalid(self, mapper):
         """Test parsing invalid datetime returns None."""
         result = mapper._parse_event_datetime("invalid", "14:30:00", "+00:00")
@@ -162,19 +237,166 @@ class TestMydhlApiMapper:
         result = mapper._parse_date("invalid-date")
         assert result is None
 
-    def test_get_latest_event(self, mapper):
-        """Test getting latest event from list."""
-        events = [
-            {"Date": "2026-01-24", "Time": "10:00:00", "GMTOffset": "+00:00"},
-            {"Date": "2026-01-25", "Time": "14:30:00", "GMTOffset": "+00:00"},
-            {"Date": "2026-01-25", "Time": "12:00:00", "GMTOffset": "+00:00"},
+    @pytest.mark.parametrize(
+        "date_str, expected",
+        [
+            ("2026-02-30", None),
+            ("2026-01-25T10:00:00", None),
+            ("2026-1-5", "2026-01-05"),
+            ("24-1-5", None),
+            ("02026-01-05", None),
+            ("2026-001-05", None),
+            ("2026-01-005", None),
+            (None, None),
+        ],
+    )
+    def test_parse_date_edge_cases(self, mapper, date_str, expected):
+        """Test out-of-range, non-canonical and missing dates."""
+        assert mapper._parse_date(date_str) == expected
+
+    def test_map_tracking_response_latest_event_fields(self, mapper):
+        """Test the latest event (not the last listed) drives summary fields."""
+        carrier_response = {
+            "TrackingResponse": {
+                "AWBInfo": {
+                    "ArrayOfAWBInfoItem": [
+                        {
+                            "ShipmentInfo": {
+                                "ShipmentEvent": {
+                                    "ArrayOfShipmentEventItem": [
+                                        {
+                                            "Date": "2026-01-25",
+                                            "Time": "14:30:00",
+                                            "ServiceArea": {"Description": "London"},
+                                            "Signatory": "J SMITH",
+                                        },
+                                        {
+                                            "Date": "2026-01-24",
+                                            "Time": "09:00:00",
+                                            "ServiceArea": {"Description": "Leipzig"},
+                                        },
+                                    ]
+                                }
+                            },
+                        }
+                    ]
+                }
+            }
+        }
+
+        result = mapper.map_tracking_response(carrier_response)
+
+        assert result["last_update"] == "2026-01-25T14:30:00"
+        assert result["current_location"] == "London"
+        assert result["signed_by"] == "J SMITH"
+        assert [e["event_location"] for e in result["events"]] == [
+            "London",
+            "Leipzig",
+        ]
+
+    def test_map_tracking_response_malformed_values(self, mapper):
+        """Test malformed nested values are skipped without losing good fields."""
+        carrier_response = {
+            "TrackingResponse": {
+                "AWBInfo": {
+                    "ArrayOfAWBInfoItem": [
+                        {
+                            "AWBNumber": "1234567890",
+                            "Status": {"ActionStatus": 42},
+                            "ShipmentInfo": {
+                                "EstimatedDeliveryDate": "2026-01-30",
+                                "ShipmentEvent": {
+                                    "ArrayOfShipmentEventItem": [
+                                        "not-an-event",
+                                        {"Date": "2026-01-25", "ServiceEvent": "bad"},
+                                    ]
+                                },
+                            },
+                        }
+                    ]
+                }
+            }
+        }
+
+        result = mapper.map_tracking_response(carrier_response)
+
+        assert result["tracking_number"] == "1234567890"
+        assert "status" not in result
+        assert result["estimated_delivery"] == "2026-01-30"
+        assert result["events"] == [
+            {
+                "event_datetime": "2026-01-25T00:00:00",
+                "event_description": None,
+                "event_location": None,
+                "event_type": None,
+            }
         ]
 
-        latest = mapper._get_latest_event(events)
-        assert latest["Date"] == "2026-01-25"
-        assert latest["Time"] == "14:30:00"
+    def test_map_tracking_response_undated_events(self, mapper):
+        """Test events without a parseable date map without a latest event."""
+        carrier_response = {
+            "TrackingResponse": {
+                "AWBInfo": {
+                    "ArrayOfAWBInfoItem": [
+                        {
+                            "AWBNumber": "1234567890",
+                            "ShipmentInfo": {
+                                "ShipmentEvent": {
+                                    "ArrayOfShipmentEventItem": [
+                                        {
+                                            "Date": "not-a-date",
+                                            "ServiceEvent": {"EventCode": "OK"},
+                                        }
+                                    ]
+                                }
+                            },
+                        }
+                    ]
+                }
+            }
+        }
 
-    def test_get_latest_event_empty(self, mapper):
-        """Test getting latest event from empty list."""
-        result = mapper._get_latest_event([])
-        assert result is None
+        result = mapper.map_tracking_response(carrier_response)
+
+        assert result["events"][0]["event_type"] == "OK"
+        assert "last_update" not in result
+        assert "signed_by" not in result
+
+    def test_parse_event_datetime_is_cached(self, mapper):
+        """Test repeated (date, time, offset) triples reuse one parsed value."""
+        first = mapper._parse_event_datetime("2026-01-25", "14:30", "+0100")
+        assert first == "2026-01-25T14:30:00+01:00"
+        assert (
+            MydhlApiMapper()._parse_event_datetime("2026-01-25", "14:30", "+0100")
+            is first
+        )
+
+    def test_map_tracking_response_latest_event_selection(self, mapper):
+        """Test the latest dated event wins; on a tie the first listed is kept."""
+        shipment_events = [
+            {"Date": "2026-01-24", "Time": "10:00:00", "Signatory": "EARLY"},
+            {"Date": "2026-01-25", "Time": "14:30:00", "Signatory": "LATEST"},
+            {"Date": "2026-01-25", "Time": "14:30:00", "Signatory": "TIE"},
+            {"Date": "2026-01-25", "Time": "12:00:00", "Signatory": "LATER-LISTED"},
+            {"Date": "not-a-date", "Signatory": "UNDATED"},
+        ]
+        carrier_response = {
+            "TrackingResponse": {
+                "AWBInfo": {
+                    "ArrayOfAWBInfoItem": [
+                        {
+                            "ShipmentInfo": {
+                                "ShipmentEvent": {
+                                    "ArrayOfShipmentEventItem": shipment_events
+                                }
+                            }
+                        }
+                    ]
+                }
+            }
+        }
+
+        result = mapper.map_tracking_response(carrier_response)
+
+        assert result["last_update"] == "2026-01-25T14:30:00"
+        assert result["signed_by"] == "LATEST"
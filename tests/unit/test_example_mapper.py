@@ -79,6 +79,20 @@ class TestExampleMapper:
 
         assert "estimated_delivery" in result
         assert result["estimated_delivery"].startswith("2026-01-30")
+        assert result["estimated_delivery"] == "2026-01-30T00:00:00Z"
+
+    @pytest.mark.parametrize(
+        "est_del, expected",
+        [
+            ("2026-1-5", "2026-01-05T00:00:00Z"),
+            ("20260105", "20260105"),
+            ("2026-W02-1", "2026-W02-1"),
+        ],
+    )
+    def test_estimated_delivery_accepted_shapes(self, est_del, expected):
+        """Test unpadded dates normalise; other ISO shapes pass through as-is."""
+        result = ExampleMapper().map_tracking_response({"est_del": est_del})
+        assert result["estimated_delivery"] == expected
 
     def test_complete_transformation(self):
         """Test complete transformation of messy carrier response."""
@@ -265,3 +279,16 @@ class TestExampleMapper:
         # Test with truly unknown format (non-numeric, non-UK pattern)
         result = mapper._derive_country_from_postcode("XYZ123")
         assert result == "GB"  # Default
+
+    def test_derive_country_zip_plus_four(self):
+        """Test ZIP+4 codes are US and near-misses default to GB."""
+        mapper = ExampleMapper()
+
+        assert mapper._derive_country_from_postcode("12345-6789") == "US"
+        assert mapper._derive_country_from_postcode("123456789") == "US"
+        assert mapper._derive_country_from_postcode("1234") == "GB"
+        assert mapper._derive_country_from_postcode("12345-678") == "GB"
+
+    def test_mapper_has_no_instance_dict(self):
+        """Test the stateless mapper uses __slots__ (no per-instance __dict__)."""
+        assert not hasattr(ExampleMapper(), "__dict__")
@@ -5,6 +5,7 @@ These tests validate that the PdfParserService works correctly.
 """
 
 import logging
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -17,20 +18,55 @@ from src.pdf_parser import PdfParserService
 class TestPdfParserService:
     """Test PDF Parser Service."""
 
+    # The mock-based tests patch pdfplumber, so these fixtures pin that
+    # backend; the default (PyMuPDF) backend is tested on real PDFs below.
+
     @pytest.fixture
     def parser(self):
         """Create parser instance for testing"""
-        return PdfParserService()
+        return PdfParserService(config={"backend": "pdfplumber"})
 
     @pytest.fixture
     def parser_with_tables(self):
         """Create parser with table extraction enabled"""
-        return PdfParserService(config={"extract_tables": True})
+        return PdfParserService(
+            config={"extract_tables": True, "backend": "pdfplumber"}
+        )
 
     @pytest.fixture
     def parser_without_combine(self):
         """Create parser with page separation enabled"""
-        return PdfParserService(config={"combine_pages": False})
+        return PdfParserService(
+            config={"combine_pages": False, "backend": "pdfplumber"}
+        )
+
+    @pytest.fixture
+    def two_page_pdf(self, tmp_path):
+        """Write a real two-page PDF with extractable text (via PyMuPDF)"""
+        import pymupdf
+
+        doc = pymupdf.open()
+        for text in ("Tracking API endpoint", "POST /shipments request"):
+            page = doc.new_page()
+            page.insert_text((72, 72), text)
+        pdf_file = tmp_path / "two_pages.pdf"
+        doc.save(str(pdf_file))
+        doc.close()
+        return str(pdf_file)
+
+    @pytest.fixture
+    def ten_page_pdf(self, tmp_path):
+        """Write a real ten-page PDF with one numbered line per page"""
+        import pymupdf
+
+        doc = pymupdf.open()
+        for page_num in range(1, 11):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Endpoint section {page_num}")
+        pdf_file = tmp_path / "ten_pages.pdf"
+        doc.save(str(pdf_file))
+        doc.close()
+        return str(pdf_file)
 
     @pytest.fixture
     def mock_pdf_with_text(self):
@@ -78,6 +114,122 @@ class TestPdfParserService:
         assert parser.extract_tables is False
         assert parser.combine_pages is True
 
+    def test_default_backend_is_pymupdf(self):
+        """
+        Test the PyMuPDF backend is the default and unknown backends are rejected.
+        """
+        assert PdfParserService().backend == "pymupdf"
+        with pytest.raises(ValueError, match="Unknown PDF backend"):
+            PdfParserService(config={"backend": "nope"})
+
+    def test_pymupdf_backend_extracts_pages(self, two_page_pdf):
+        """
+        Test the default backend extracts every page, with optional separators.
+        """
+        assert PdfParserService().extract_text(two_page_pdf) == (
+            "Tracking API endpoint\nPOST /shipments request"
+        )
+        separated = PdfParserService(config={"combine_pages": False}).extract_text(
+            two_page_pdf
+        )
+        assert "--- Page 1 ---\nTracking API endpoint" in separated
+        assert "--- Page 2 ---\nPOST /shipments request" in separated
+        assert PdfParserService().extract_metadata(two_page_pdf)["page_count"] == 2
+
+    def test_pymupdf_backend_matches_pdfplumber_text(self, two_page_pdf):
+        """
+        Test both backends extract the same text from a simple PDF.
+        """
+        pymupdf_text = PdfParserService().extract_text(two_page_pdf)
+        pdfplumber_text = PdfParserService(
+            config={"backend": "pdfplumber"}
+        ).extract_text(two_page_pdf)
+        assert pymupdf_text == pdfplumber_text
+
+    @pytest.mark.parametrize("backend", ["pymupdf", "pdfplumber"])
+    def test_parallel_extraction_matches_sequential(self, ten_page_pdf, backend):
+        """
+        Test worker-process extraction keeps page order and output identical.
+        """
+        sequential = PdfParserService(
+            config={"backend": backend, "combine_pages": False, "max_workers": 1}
+        ).extract_text(ten_page_pdf)
+        parallel = PdfParserService(
+            config={
+                "backend": backend,
+                "combine_pages": False,
+                "parallel": True,
+                "parallel_min_pages": 2,
+                "max_workers": 3,
+            }
+        ).extract_text(ten_page_pdf)
+        assert parallel == sequential
+        assert parallel.index("--- Page 9 ---") < parallel.index("--- Page 10 ---")
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"max_workers": 4},
+            {"max_workers": 4, "parallel": True, "parallel_min_pages": 20},
+        ],
+    )
+    def test_worker_processes_are_opt_in(self, ten_page_pdf, config):
+        """
+        Test no process pool starts unless 'parallel' is set and the PDF is large.
+        """
+        with patch("src.pdf_parser.ProcessPoolExecutor") as mock_executor:
+            PdfParserService(config=config).extract_text(ten_page_pdf)
+        mock_executor.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            {"side_effect": OSError("cannot start workers")},
+            {
+                "return_value.__enter__.return_value.map.side_effect": (
+                    BrokenProcessPool("worker died")
+                )
+            },
+        ],
+    )
+    def test_parallel_extraction_falls_back_in_process(
+        self, ten_page_pdf, failure, caplog
+    ):
+        """
+        Test a pool that cannot start or breaks falls back to in-process extraction.
+        """
+        expected = PdfParserService().extract_text(ten_page_pdf)
+        parser = PdfParserService(
+            config={"parallel": True, "parallel_min_pages": 2, "max_workers": 2}
+        )
+        with patch("src.pdf_parser.ProcessPoolExecutor", **failure) as mock_executor:
+            with caplog.at_level(logging.WARNING):
+                text = parser.extract_text(ten_page_pdf)
+        mock_executor.assert_called_once()
+        assert text == expected
+        assert "extracting in-process" in caplog.text
+
+    def test_extract_text_then_metadata_opens_pdf_once(self, two_page_pdf):
+        """
+        Test extract_metadata after extract_text reuses the single open.
+        """
+        import pymupdf
+
+        parser = PdfParserService()
+        with patch("src.pdf_parser.pymupdf.open", wraps=pymupdf.open) as mock_open:
+            parser.extract_text(two_page_pdf)
+            metadata = parser.extract_metadata(two_page_pdf)
+        assert mock_open.call_count == 1
+        assert metadata["page_count"] == 2
+        assert metadata["file_size"] == Path(two_page_pdf).stat().st_size
+
+        # A modified file is re-read rather than served from the stale entry
+        with patch("src.pdf_parser.pymupdf.open", wraps=pymupdf.open) as mock_open:
+            with open(two_page_pdf, "ab") as f:
+                f.write(b"\n")
+            assert parser.extract_metadata(two_page_pdf)["page_count"] == 2
+        assert mock_open.call_count == 1
+
     def test_initializes_with_custom_config(self):
         """
         Test service initialization with custom config.
@@ -123,15 +275,13 @@ class TestPdfParserService:
         assert "empty" in str(exc_info.value).lower()
 
     @patch("src.pdf_parser.pdfplumber")
-    @patch.object(PdfParserService, "_get_page_count")
     def test_extract_text_success(
-        self, mock_get_page_count, mock_pdfplumber, parser, mock_pdf_with_text, tmp_path
+        self, mock_pdfplumber, parser, mock_pdf_with_text, tmp_path
     ):
         """
         Test successful text extraction.
         """
         mock_pdfplumber.open.return_value = mock_pdf_with_text
-        mock_get_page_count.return_value = 1  # Mock page count to avoid second PDF open
 
         # Create a temporary file path
         pdf_file = tmp_path / "test.pdf"
@@ -140,14 +290,12 @@ class TestPdfParserService:
         text = parser.extract_text(str(pdf_file))
 
         assert text == "Sample PDF text content"
-        # PDF is opened once for extraction, _get_page_count is mocked so no second open
+        # PDF is opened once: the page count comes from the same open document
         assert mock_pdfplumber.open.call_count == 1
 
     @patch("src.pdf_parser.pdfplumber")
-    @patch.object(PdfParserService, "_get_page_count")
     def test_extract_text_handles_multiple_pages(
         self,
-        mock_get_page_count,
         mock_pdfplumber,
         parser,
         mock_pdf_multiple_pages,
@@ -157,7 +305,6 @@ class TestPdfParserService:
         Test text extraction from multiple pages.
         """
         mock_pdfplumber.open.return_value = mock_pdf_multiple_pages
-        mock_get_page_count.return_value = 2  # Mock page count
 
         pdf_file = tmp_path / "multi-page.pdf"
         pdf_file.write_bytes(b"%PDF-1.4\n")
@@ -168,10 +315,8 @@ class TestPdfParserService:
         assert "Page 2 content" in text
 
     @patch("src.pdf_parser.pdfplumber")
-    @patch.object(PdfParserService, "_get_page_count")
     def test_extract_text_with_page_separators(
         self,
-        mock_get_page_count,
         mock_pdfplumber,
         parser_without_combine,
         mock_pdf_multiple_pages,
@@ -181,7 +326,6 @@ class TestPdfParserService:
         Test text extraction with page separators when combine_pages=False.
         """
         mock_pdfplumber.open.return_value = mock_pdf_multiple_pages
-        mock_get_page_count.return_value = 2  # Mock page count
 
         pdf_file = tmp_path / "multi-page.pdf"
         pdf_file.write_bytes(b"%PDF-1.4\n")
@@ -194,10 +338,8 @@ class TestPdfParserService:
         assert "Page 2 content" in text
 
     @patch("src.pdf_parser.pdfplumber")
-    @patch.object(PdfParserService, "_get_page_count")
     def test_extract_text_with_tables_enabled(
         self,
-        mock_get_page_count,
         mock_pdfplumber,
         parser_with_tables,
         mock_pdf_with_tables,
@@ -207,7 +349,6 @@ class TestPdfParserService:
         Test text extraction with table extraction enabled.
         """
         mock_pdfplumber.open.return_value = mock_pdf_with_tables
-        mock_get_page_count.return_value = 1  # Mock page count
 
         pdf_file = tmp_path / "with-tables.pdf"
         pdf_file.write_bytes(b"%PDF-1.4\n")
@@ -223,10 +364,8 @@ class TestPdfParserService:
         assert "Value2" in text
 
     @patch("src.pdf_parser.pdfplumber")
-    @patch.object(PdfParserService, "_get_page_count")
     def test_extract_text_with_tables_disabled(
         self,
-        mock_get_page_count,
         mock_pdfplumber,
         parser,
         mock_pdf_with_tables,
@@ -236,7 +375,6 @@ class TestPdfParserService:
         Test that tables are not extracted when extract_tables=False.
         """
         mock_pdfplumber.open.return_value = mock_pdf_with_tables
-        mock_get_page_count.return_value = 1  # Mock page count
 
         pdf_file = tmp_path / "with-tables.pdf"
         pdf_file.write_bytes(b"%PDF-1.4\n")
@@ -247,10 +385,8 @@ class TestPdfParserService:
         assert "[Table" not in text  # Tables should not be included
 
     @patch("src.pdf_parser.pdfplumber")
-    @patch.object(PdfParserService, "_get_page_count")
     def test_extract_text_logs_progress(
         self,
-        mock_get_page_count,
         mock_pdfplumber,
         parser,
         mock_pdf_with_text,
@@ -261,7 +397,6 @@ class TestPdfParserService:
         Test that text extraction is logged.
         """
         mock_pdfplumber.open.return_value = mock_pdf_with_text
-        mock_get_page_count.return_value = 1  # Mock to avoid second PDF open
 
         pdf_file = tmp_path / "test.pdf"
         pdf_file.write_bytes(b"%PDF-1.4\n")
@@ -328,9 +463,8 @@ class TestPdfParserService:
         )
 
     @patch("src.pdf_parser.pdfplumber")
-    @patch.object(PdfParserService, "_get_page_count")
     def test_extract_text_handles_empty_pages_in_multi_page_pdf(
-        self, mock_get_page_count, mock_pdfplumber, parser, tmp_path
+        self, mock_pdfplumber, parser, tmp_path
     ):
         """
         Test handling of empty pages in multi-page PDF.
@@ -348,7 +482,6 @@ class TestPdfParserService:
         mock_pdf.__enter__ = Mock(return_value=mock_pdf)
         mock_pdf.__exit__ = Mock(return_value=None)
         mock_pdfplumber.open.return_value = mock_pdf
-        mock_get_page_count.return_value = 2  # Mock page count
 
         pdf_file = tmp_path / "mixed-pages.pdf"
         pdf_file.write_bytes(b"%PDF-1.4\n")
@@ -474,40 +607,25 @@ class TestPdfParserService:
             )
 
     @patch("src.pdf_parser.pdfplumber")
-    def test_get_page_count_success(self, mock_pdfplumber, parser, tmp_path):
+    def test_extract_text_logs_page_count_from_single_open(
+        self, mock_pdfplumber, parser, tmp_path, caplog
+    ):
         """
-        Test _get_page_count successfully returns page count.
-
-        This tests the success path on line 305.
+        Test the logged page count is read from the document opened for text.
         """
-        # Mock pdfplumber with a PDF that has pages
         mock_pdf = MagicMock()
-        mock_pdf.pages = [MagicMock(), MagicMock(), MagicMock()]  # 3 pages
+        mock_page = MagicMock()
+        mock_page.extract_text.return_value = "Page text"
+        mock_pdf.pages = [mock_page, mock_page, mock_page]  # 3 pages
         mock_pdf.__enter__ = Mock(return_value=mock_pdf)
         mock_pdf.__exit__ = Mock(return_value=None)
-
         mock_pdfplumber.open.return_value = mock_pdf
 
         pdf_file = tmp_path / "test.pdf"
         pdf_file.write_bytes(b"%PDF-1.4\n")
 
-        # Should return page count successfully
-        page_count = parser._get_page_count(str(pdf_file))
-        assert page_count == 3
-
-    @patch("src.pdf_parser.pdfplumber")
-    def test_get_page_count_handles_errors(self, mock_pdfplumber, parser, tmp_path):
-        """
-        Test _get_page_count error handling.
-
-        This tests the exception handling on lines 303-307.
-        """
-        # Mock pdfplumber to raise an exception
-        mock_pdfplumber.open.side_effect = Exception("PDF error")
-
-        pdf_file = tmp_path / "error.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4\n")
+        with caplog.at_level(logging.INFO):
+            parser.extract_text(str(pdf_file))
 
-        # Should return 0 on error (not raise exception)
-        page_count = parser._get_page_count(str(pdf_file))
-        assert page_count == 0
+        assert mock_pdfplumber.open.call_count == 1
+        assert [r.pages for r in caplog.records if hasattr(r, "pages")] == [3]
@@ -0,0 +1,134 @@
+"""
+Tests for Royal Mail Rest API Mapper.
+
+"""
+
+import pytest
+
+from src.mappers.royal_mail_mapper import RoyalMailRestApiMapper
+
+
+@pytest.mark.unit
+class TestRoyalMailRestApiMapper:
+    """Test RoyalMailRestApiMapper."""
+
+    @pytest.fixture
+    def mapper(self):
+        """Create mapper instance."""
+        return RoyalMailRestApiMapper()
+
+    def test_mapping_tables_are_read_only(self, mapper):
+        """FIELD_MAPPING / STATUS_MAPPING are shared, read-only tables."""
+        with pytest.raises(TypeError):
+            mapper.STATUS_MAPPING["DELIVERED"] = "other"
+        with pytest.raises(TypeError):
+            mapper.FIELD_MAPPING["status"] = "other"
+        assert mapper.FIELD_MAPPING is RoyalMailRestApiMapper().FIELD_MAPPING
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("IN_TRANSIT", "in_transit"),
+            ("in_transit", "in_transit"),
+            ("In_Transit", "in_transit"),
+            ("iN_tRANSIT", "in_transit"),
+            ("Held At Customs", "held at customs"),
+            (42, "42"),
+        ],
+    )
+    def test_status_mapping(self, mapper, raw, expected):
+        """Test status casing drift maps and unknown statuses are lowercased."""
+        result = mapper.map_tracking_response({"status": raw})
+        assert result["status"] == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2026-01-25T14:30:00Z", "2026-01-25T14:30:00+00:00"),
+            ("2026-01-25T14:30:00+01:00", "2026-01-25T14:30:00+01:00"),
+            ("2026-01-25", "2026-01-25T00:00:00"),
+            ("2026-1-5", "2026-01-05T00:00:00"),
+            ("2026-01-25 14:30:00", "2026-01-25T14:30:00"),
+            ("2026-1-5 9:05:00", "2026-01-05T09:05:00"),
+            ("25/01/2026", "2026-01-25T00:00:00"),
+            ("01/25/2026", "2026-01-25T00:00:00"),
+        ],
+    )
+    def test_parse_date_formats(self, mapper, value, expected):
+        """Test each supported date shape parses to ISO 8601."""
+        assert mapper._parse_date(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "not-a-date",
+            "2026-13-45",
+            "2026-02-30 10:00:00",
+            "25.01.2026",
+            "",
+            None,
+            20260125,
+        ],
+    )
+    def test_parse_date_invalid(self, mapper, value):
+        """Test unsupported or out-of-range dates return None."""
+        assert mapper._parse_date(value) is None
+
+    def test_parse_date_is_shared_across_instances(self, mapper):
+        """Test repeated date strings reuse one cached parse."""
+        assert mapper._parse_date(
+            "2026-01-25T14:30:00+01:00"
+        ) is RoyalMailRestApiMapper()._parse_date("2026-01-25T14:30:00+01:00")
+
+    def test_map_tracking_response_events(self, mapper):
+        """Test events and simple fields map to the universal format."""
+        result = mapper.map_tracking_response(
+            {
+                "trackingNumber": "RM123456789GB",
+                "status": "IN_TRANSIT",
+                "lastUpdate": "2026-01-25 14:30:00",
+                "events": [
+                    {
+                        "eventType": "ACCEPTED",
+                        "eventDateTime": "24/01/2026",
+                        "eventDescription": "Item accepted",
+                        "location": {"city": "London", "postalCode": "EC1A 1BB"},
+                    }
+                ],
+            }
+        )
+        assert result["tracking_number"] == "RM123456789GB"
+        assert result["status"] == "in_transit"
+        assert result["last_update"] == "2026-01-25T14:30:00"
+        assert result["events"] == [
+            {
+                "event_type": "ACCEPTED",
+                "event_datetime": "2026-01-24T00:00:00",
+                "event_description": "Item accepted",
+                "event_location": "London, EC1A 1BB",
+            }
+        ]
+
+    def test_format_location(self, mapper):
+        """Test location parts are stripped and joined in address order."""
+        location = {
+            "country": "GB",
+            "city": " London ",
+            "addressLine1": "1 High St",
+            "state": "",
+            "postalCode": "EC1A 1BB",
+        }
+        assert mapper._format_location(location) == "1 High St, London, EC1A 1BB, GB"
+        assert mapper._format_location({}) == ""
+        assert mapper._format_location({"lat": 51.5, "lng": -0.1}) == ""
+
+    def test_map_events_skips_non_dict_entries(self, mapper):
+        """Test malformed event entries are skipped, not fatal."""
+        events = [None, "bad", {"eventType": "DELIVERED"}, {}]
+        assert mapper._map_events(events) == [{"event_type": "DELIVERED"}]
+        assert mapper._map_events("bad") == []
+        assert mapper._map_events([]) == []
+
+    def test_mapper_has_no_instance_dict(self, mapper):
+        """Test the stateless mapper uses __slots__ (no per-instance __dict__)."""
+        assert not hasattr(mapper, "__dict__")